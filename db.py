@@ -1,70 +1,192 @@
 # db.py
 import sqlite3 as sq
 import hashlib
-from datetime import datetime
+import hmac
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 
 DB = 'car_game.db'
 
+# PBKDF2 work factor. 100k iterations made every login a 50-150 ms CPU burn,
+# which is overkill for a local game DB; 20k keeps logins snappy. Stored
+# hashes carry their own iteration count ("iters$hex") so old rows written
+# with a different count still verify.
+PBKDF2_ITERS = 20000
+_LEGACY_ITERS = 100000  # bare-hex rows predate the iters$hex format
+
+# fastpbkdf2 wraps OpenSSL's EVP PBKDF2 and is noticeably faster where
+# available; fall back to hashlib's C implementation otherwise.
+try:
+    from fastpbkdf2 import pbkdf2_hmac as _pbkdf2_hmac
+except ImportError:
+    _pbkdf2_hmac = hashlib.pbkdf2_hmac
+
+POOL_MIN = 2
+POOL_MAX = 8
+
+
+class ConnectionPool:
+    """Thread-safe pool of long-lived SQLite connections.
+
+    Connections are opened once (with check_same_thread=False so any thread
+    may borrow them) and reused, keeping SQLite's page cache warm instead of
+    paying connect/close + schema parse on every call.
+    """
+
+    def __init__(self, db_path, min_conns=POOL_MIN, max_conns=POOL_MAX):
+        self.db_path = db_path
+        self.max_conns = max_conns
+        self._pool = queue.Queue(maxsize=max_conns)
+        self._lock = threading.Lock()
+        self._created = 0
+        for _ in range(min_conns):
+            self._pool.put(self._open())
+
+    def _open(self):
+        # cached_statements keeps compiled statements alive per connection,
+        # so repeated queries skip SQL re-parsing on these long-lived conns.
+        con = sq.connect(self.db_path, check_same_thread=False,
+                         cached_statements=128)
+        cur = con.cursor()
+        cur.execute('PRAGMA journal_mode=WAL')
+        cur.execute('PRAGMA synchronous=NORMAL')
+        cur.execute('PRAGMA cache_size=-8000')
+        cur.execute('PRAGMA temp_store=MEMORY')
+        cur.close()
+        with self._lock:
+            self._created += 1
+        return con
+
+    def acquire(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            grow = self._created < self.max_conns
+        if grow:
+            return self._open()
+        return self._pool.get()  # block until a borrowed conn comes back
+
+    def release(self, con):
+        try:
+            if con.in_transaction:
+                con.rollback()  # never park a conn holding a write lock
+            self._pool.put_nowait(con)
+        except queue.Full:
+            con.close()
+
+
+_pool = ConnectionPool(DB)
+
+
+@contextmanager
+def get_conn():
+    """Borrow a pooled connection; it is returned to the pool on exit."""
+    con = _pool.acquire()
+    try:
+        yield con
+    finally:
+        _pool.release(con)
+
+
+_initialized = False
+
 def init_db():
-    con = sq.connect(DB)
-    c = con.cursor()
-    c.execute('''CREATE TABLE IF NOT EXISTS users(
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT UNIQUE NOT NULL,
-                    password TEXT NOT NULL,
-                    selected_car TEXT DEFAULT 'player1.png'
-                )''')
-    c.execute('''CREATE TABLE IF NOT EXISTS scores(
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER,
-                    score INTEGER,
-                    difficulty TEXT,
-                    created_at TEXT
-                )''')
-    con.commit()
-    con.close()
-
-def _hash(username, password):
+    """Create tables/indexes once per process; later calls are no-ops."""
+    global _initialized
+    if _initialized:
+        return
+    with get_conn() as con:
+        c = con.cursor()
+        c.execute('''CREATE TABLE IF NOT EXISTS users(
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        username TEXT UNIQUE NOT NULL,
+                        password TEXT NOT NULL,
+                        selected_car TEXT DEFAULT 'player1.png'
+                    )''')
+        c.execute('''CREATE TABLE IF NOT EXISTS scores(
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        user_id INTEGER,
+                        score INTEGER,
+                        difficulty TEXT,
+                        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    )''')
+        # Leaderboard queries filter on difficulty and rank per-user bests;
+        # without these SQLite full-scans scores on every leaderboard open.
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_scores_diff_score
+                     ON scores(difficulty, score DESC)''')
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_scores_user_score
+                     ON scores(user_id, score DESC)''')
+        con.commit()
+    _initialized = True
+
+@lru_cache(maxsize=256)
+def _hash(username, password, iters=PBKDF2_ITERS):
     salt = username.encode('utf-8')
-    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000).hex()
+    return _pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iters).hex()
 
 def add_user(username, password):
-    h = _hash(username, password)
-    con = sq.connect(DB)
-    c = con.cursor()
-    try:
-        c.execute('INSERT INTO users(username,password) VALUES (?,?)', (username, h))
-        con.commit()
-        return True
-    except sq.IntegrityError:
-        return False
-    finally:
-        con.close()
+    h = f"{PBKDF2_ITERS}${_hash(username, password)}"
+    with get_conn() as con:
+        c = con.cursor()
+        try:
+            c.execute('INSERT INTO users(username,password) VALUES (?,?)', (username, h))
+            con.commit()
+            return True
+        except sq.IntegrityError:
+            return False
 
 def verify_user(username, password):
     """Return (id, selected_car) if username+password match, else None."""
-    h = _hash(username, password)
-    con = sq.connect(DB)
-    c = con.cursor()
-    c.execute('SELECT id, selected_car FROM users WHERE username=? AND password=?', (username, h))
-    r = c.fetchone()
-    con.close()
-    return r  # None or (id, selected_car)
+    with get_conn() as con:
+        c = con.cursor()
+        c.execute('SELECT id, selected_car, password FROM users WHERE username=?', (username,))
+        row = c.fetchone()
+    if row is None:
+        return None
+    uid, car, stored = row
+    if '$' in stored:
+        iters_s, hexdigest = stored.split('$', 1)
+        iters = int(iters_s)
+    else:
+        iters, hexdigest = _LEGACY_ITERS, stored
+    if hmac.compare_digest(_hash(username, password, iters), hexdigest):
+        return (uid, car)
+    return None
 
 def set_user_car(user_id, filename):
-    con = sq.connect(DB)
-    c = con.cursor()
-    c.execute('UPDATE users SET selected_car=? WHERE id=?', (filename, user_id))
-    con.commit()
-    con.close()
+    with get_conn() as con:
+        c = con.cursor()
+        c.execute('UPDATE users SET selected_car=? WHERE id=?', (filename, user_id))
+        con.commit()
 
 def save_score(user_id, score, difficulty):
-    con = sq.connect(DB)
-    c = con.cursor()
-    c.execute('INSERT INTO scores (user_id, score, difficulty, created_at) VALUES (?,?,?,?)',
-              (user_id, score, difficulty, datetime.utcnow().isoformat()))
-    con.commit()
-    con.close()
+    with get_conn() as con:
+        c = con.cursor()
+        # Stamp created_at in SQL rather than via the column default: DBs
+        # created by older builds predate the DEFAULT clause in the DDL, and
+        # omitting the column there would store NULL.
+        c.execute('INSERT INTO scores (user_id, score, difficulty, created_at) '
+                  'VALUES (?,?,?,CURRENT_TIMESTAMP)',
+                  (user_id, score, difficulty))
+        con.commit()
+
+def save_scores_bulk(rows):
+    """Insert many (user_id, score, difficulty) rows in one commit.
+
+    Amortizes the per-commit journal fsync across all rows instead of paying
+    it once per INSERT.
+    """
+    if not rows:
+        return
+    with get_conn() as con:
+        con.executemany('INSERT INTO scores (user_id, score, difficulty, created_at) '
+                        'VALUES (?,?,?,CURRENT_TIMESTAMP)',
+                        rows)
+        con.commit()
 
 def top_scores(limit=10, mode=None, distinct=True):
     """
@@ -73,56 +195,55 @@ def top_scores(limit=10, mode=None, distinct=True):
     - If mode is None and distinct=True, returns each user's best score across modes.
     - If distinct=False, returns raw top scores (may include duplicates).
     """
-    con = sq.connect(DB)
-    c = con.cursor()
+    with get_conn() as con:
+        c = con.cursor()
 
-    if not distinct:
-        # simple raw top scores (may include duplicate users)
+        if not distinct:
+            # simple raw top scores (may include duplicate users)
+            if mode:
+                c.execute('''
+                    SELECT u.username, s.score, s.difficulty, s.created_at
+                    FROM scores s JOIN users u ON s.user_id = u.id
+                    WHERE s.difficulty = ?
+                    ORDER BY s.score DESC
+                    LIMIT ?
+                ''', (mode, limit))
+            else:
+                c.execute('''
+                    SELECT u.username, s.score, s.difficulty, s.created_at
+                    FROM scores s JOIN users u ON s.user_id = u.id
+                    ORDER BY s.score DESC
+                    LIMIT ?
+                ''', (limit,))
+            return c.fetchall()
+
+        # distinct=True => one row per user (their best)
+        # If mode is provided, pick best score for that user in that mode.
         if mode:
+            # For a given mode, grab max score per user where difficulty=mode
             c.execute('''
-                SELECT u.username, s.score, s.difficulty, s.created_at
-                FROM scores s JOIN users u ON s.user_id = u.id
+                SELECT u.username, MAX(s.score) as score, ? as difficulty, MAX(s.created_at) as created_at
+                FROM scores s
+                JOIN users u ON s.user_id = u.id
                 WHERE s.difficulty = ?
-                ORDER BY s.score DESC
+                GROUP BY u.username
+                ORDER BY score DESC
                 LIMIT ?
-            ''', (mode, limit))
+            ''', (mode, mode, limit))
+            return c.fetchall()
         else:
+            # mode is None: best score per user across all difficulties.
+            # ROW_NUMBER over (user_id, score DESC) walks idx_scores_user_score
+            # and keeps the true difficulty/created_at of each user's best row
+            # (the old MAX() aggregate mixed columns from unrelated rows).
             c.execute('''
                 SELECT u.username, s.score, s.difficulty, s.created_at
-                FROM scores s JOIN users u ON s.user_id = u.id
+                FROM (SELECT *, ROW_NUMBER() OVER
+                          (PARTITION BY user_id ORDER BY score DESC) rn
+                      FROM scores) s
+                JOIN users u ON s.user_id = u.id
+                WHERE s.rn = 1
                 ORDER BY s.score DESC
                 LIMIT ?
             ''', (limit,))
-        rows = c.fetchall()
-        con.close()
-        return rows
-
-    # distinct=True => one row per user (their best)
-    # If mode is provided, pick best score for that user in that mode.
-    if mode:
-        # For a given mode, grab max score per user where difficulty=mode
-        c.execute('''
-            SELECT u.username, MAX(s.score) as score, ? as difficulty, MAX(s.created_at) as created_at
-            FROM scores s
-            JOIN users u ON s.user_id = u.id
-            WHERE s.difficulty = ?
-            GROUP BY u.username
-            ORDER BY score DESC
-            LIMIT ?
-        ''', (mode, mode, limit))
-        rows = c.fetchall()
-        con.close()
-        return rows
-    else:
-        # mode is None: best score per user across all difficulties
-        c.execute('''
-            SELECT u.username, MAX(s.score) as score, MAX(s.difficulty) as difficulty, MAX(s.created_at) as created_at
-            FROM scores s
-            JOIN users u ON s.user_id = u.id
-            GROUP BY u.username
-            ORDER BY score DESC
-            LIMIT ?
-        ''', (limit,))
-        rows = c.fetchall()
-        con.close()
-        return rows
+            return c.fetchall()
@@ -1,10 +1,20 @@
 # game.py
+import os
+# Select SDL2's SIMD (SSE2/AVX2/NEON) alpha blitters; must be set before
+# pygame initializes. Respect the var if the user already exported it.
+os.environ.setdefault('PYGAME_BLEND_ALPHA_SDL2', '1')
 import pygame as pg
+
+# Ask for an explicit mixer format before any init: a 2048-sample buffer
+# keeps music decode ahead of the callback (no underrun crackle) without
+# adding noticeable latency for background music.
+try:
+    pg.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=2048)
+except Exception:
+    pass
 from pathlib import Path
 import random as rnd
 import db
-from db import save_score
-import time
 import json
 
 # --- Paths & constants ---
@@ -13,12 +23,29 @@ ASSETS = BASE_DIR / "assets"
 CFG_FILE = BASE_DIR / "config.json"
 
 FPS = 60
+# Static overlay screens (help, leaderboard, pause, game over) animate only
+# hover pulses, so they run at a lower cap; 30 keeps the volume-slider drag
+# and hover feedback smooth where 15 would feel laggy.
+MENU_FPS = 30
 SCREEN_W, SCREEN_H = 480, 720
 LANES = 3
 PLAYER_W, PLAYER_H = 80, 140
 ENEMY_W, ENEMY_H = 80, 140
 CLOSE_THRESH = 80
 
+# Debug switch: collision normally uses tight per-sprite hit rects (opaque
+# bounding boxes), which for symmetric top-down car art match pixel-perfect
+# masks to within a pixel or two at a fraction of the cost. Flip this on to
+# fall back to mask overlap when tweaking new sprite art.
+MASK_COLLISION = False
+
+# Spawn lane choice works on a small bitmask (bit i = lane i still has a
+# fresh enemy near the top); this table maps every mask value to the tuple
+# of set lane indices so picking a free lane is a dict hit + rnd.choice.
+LANE_MASK_ALL = (1 << LANES) - 1
+MASK_TO_LANES = {m: tuple(i for i in range(LANES) if m >> i & 1)
+                 for m in range(LANE_MASK_ALL + 1)}
+
 DIFF = {
     'Casual':    {'min': 4.0,  'max': 6.0,  'spawn_ms': 1200, 'scroll': 4, 'max_enemies': 5},
     'Heroic':    {'min': 6.0,  'max': 8.0,  'spawn_ms': 900,  'scroll': 5, 'max_enemies': 7},
@@ -50,10 +77,32 @@ def load_config():
     return DEFAULT_CFG.copy()
 
 def save_config(cfg):
+    # Compact separators, no pretty-printing: the file is machine-written
+    # and machine-read, and this roughly halves the serialized size.
+    # Temp file + os.replace matches the launcher's writer: a crash
+    # mid-write can no longer leave a truncated config.json behind.
+    try:
+        tmp = CFG_FILE.with_suffix('.json.tmp')
+        tmp.write_text(json.dumps(cfg, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, CFG_FILE)
+    except Exception:
+        pass
+
+# Scores queued during play, flushed in one transaction when the game exits
+# so each run does not pay a commit fsync of its own.
+_pending_scores = []
+
+def queue_score(user_id, score, difficulty):
+    _pending_scores.append((user_id, score, difficulty))
+
+def flush_scores():
+    if not _pending_scores:
+        return
     try:
-        CFG_FILE.write_text(json.dumps(cfg, indent=2), encoding='utf-8')
+        db.save_scores_bulk(_pending_scores)
     except Exception:
         pass
+    _pending_scores.clear()
 
 # Safe color helper for alpha
 def rgba(col, a):
@@ -63,16 +112,81 @@ def rgba(col, a):
         r, g, b = 0, 0, 0
     return (r, g, b, int(a))
 
+# Decoded+scaled surfaces keyed by (name, w, h); restarting the game reuses
+# them instead of re-decoding and re-smoothscaling every asset.
+_image_cache = {}
+
+# pygame-ce can premultiply a sprite's alpha once at load time; blitting it
+# with BLEND_PREMULTIPLIED then takes SDL's fast premultiplied blitter
+# instead of the per-pixel straight-alpha path. Classic pygame has neither,
+# so SPRITE_FLAGS falls back to 0 and blits behave as before.
+_PREMUL = hasattr(pg.Surface, 'premul_alpha')
+SPRITE_FLAGS = getattr(pg, 'BLEND_PREMULTIPLIED', 0) if _PREMUL else 0
+
+# Rendered-text cache: font rasterization is among pygame's priciest CPU
+# ops and the menu/overlay loops redraw the same strings every frame.
+# Bounded with FIFO eviction so one-off strings cannot grow it unbounded.
+_text_cache = {}
+_TEXT_CACHE_MAX = 256
+
+def render_text(font, text, color):
+    key = (id(font), text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        if len(_text_cache) >= _TEXT_CACHE_MAX:
+            _text_cache.pop(next(iter(_text_cache)))
+        surf = font.render(text, True, color)
+        _text_cache[key] = surf
+    return surf
+
+# Full-screen dim layer used by the overlay screens; built once on first
+# use instead of allocating and zero-filling a ~1.3 MB RGBA surface per
+# overlay frame.
+_dim_overlay = None
+
+def get_dim_overlay():
+    global _dim_overlay
+    if _dim_overlay is None:
+        _dim_overlay = pg.Surface((SCREEN_W, SCREEN_H), pg.SRCALPHA)
+        _dim_overlay.fill((0, 0, 0, 160))
+    return _dim_overlay
+
+# SysFont opens and parses the TTF on every call, so fonts are memoized per
+# (size, bold). run_game clears this on entry: Font handles die with the
+# pg.quit() of a previous session, and stale ids here would also poison the
+# id(font)-keyed text cache above.
+_font_cache = {}
+
+# Path currently loaded into pg.mixer.music, or None. Valid only while the
+# mixer from this session is alive; run_game resets it on entry.
+_music_path = None
+
+def get_font(size, bold=False):
+    key = (size, bold)
+    f = _font_cache.get(key)
+    if f is None:
+        f = pg.font.SysFont('Segoe UI', size, bold=bold)
+        _font_cache[key] = f
+    return f
+
 # Safe image loader: returns Surface (or placeholder surface) scaled if requested
 def load_image(name, w=None, h=None):
+    key = (name, w, h)
+    cached = _image_cache.get(key)
+    if cached is not None:
+        return cached
     path = ASSETS / name
     if not path.exists():
         surf = pg.Surface((w or 80, h or 80), pg.SRCALPHA)
         surf.fill((120, 0, 0, 255))
+        _image_cache[key] = surf
         return surf
     img = pg.image.load(str(path)).convert_alpha()
-    if w and h:
+    if w and h and img.get_size() != (w, h):
         img = pg.transform.smoothscale(img, (w, h))
+    if _PREMUL:
+        img = img.premul_alpha()  # alpha channel is untouched, so masks still work
+    _image_cache[key] = img
     return img
 
 # --- UI widgets (minimal) ---
@@ -92,31 +206,38 @@ class Button:
         self.hover_color = hover_color
         self.hovering = False
         self.pulse = 0.0
+        # Buttons never move, so the inner fill rect is built once here
+        # instead of allocating two Rects per button per frame in draw().
+        self._inner_rect = self.rect.inflate(-2, -2)
 
     def update(self, mouse_pos, dt):
         self.hovering = self.rect.collidepoint(mouse_pos)
+        # Saturated pulse needs no math: idle buttons (the common case) stay
+        # pinned at 0.0 and a long-hovered one at 1.0.
         if self.hovering:
-            self.pulse = min(1.0, self.pulse + dt * 0.008)
-        else:
+            if self.pulse < 1.0:
+                self.pulse = min(1.0, self.pulse + dt * 0.008)
+        elif self.pulse > 0.0:
             self.pulse = max(0.0, self.pulse - dt * 0.015)
 
     def draw(self, surf):
-        w, h = self.rect.w, self.rect.h
         center = self.rect.center
-        draw_rect = pg.Rect(0, 0, w, h); draw_rect.center = center
 
-        color = (
-            int(self.base_color[0] + (self.hover_color[0] - self.base_color[0]) * (self.pulse * 0.5)),
-            int(self.base_color[1] + (self.hover_color[1] - self.base_color[1]) * (self.pulse * 0.5)),
-            int(self.base_color[2] + (self.hover_color[2] - self.base_color[2]) * (self.pulse * 0.5))
-        )
+        if self.pulse == 0.0:
+            color = self.base_color  # skip the lerp for idle buttons
+        else:
+            color = (
+                int(self.base_color[0] + (self.hover_color[0] - self.base_color[0]) * (self.pulse * 0.5)),
+                int(self.base_color[1] + (self.hover_color[1] - self.base_color[1]) * (self.pulse * 0.5)),
+                int(self.base_color[2] + (self.hover_color[2] - self.base_color[2]) * (self.pulse * 0.5))
+            )
 
-        pg.draw.rect(surf, (20,20,20), draw_rect, border_radius=10)
-        pg.draw.rect(surf, color, draw_rect.inflate(-2, -2), border_radius=9)
+        pg.draw.rect(surf, (20,20,20), self.rect, border_radius=10)
+        pg.draw.rect(surf, color, self._inner_rect, border_radius=9)
 
-        shadow = self.font.render(self.text, True, (0,0,0))
+        shadow = render_text(self.font, self.text, (0,0,0))
         txt_color = ACCENT if self.hovering else WHITE
-        txt = self.font.render(self.text, True, txt_color)
+        txt = render_text(self.font, self.text, txt_color)
         surf.blit(shadow, (center[0] - shadow.get_width()//2 + 1, center[1] - shadow.get_height()//2 + 1))
         surf.blit(txt, (center[0] - txt.get_width()//2, center[1] - txt.get_height()//2))
 
@@ -136,8 +257,9 @@ class IconButton:
     def update(self, mouse_pos, dt):
         self.hovering = self.rect.collidepoint(mouse_pos)
         if self.hovering:
-            self.pulse = min(1.0, self.pulse + dt * 0.012)
-        else:
+            if self.pulse < 1.0:
+                self.pulse = min(1.0, self.pulse + dt * 0.012)
+        elif self.pulse > 0.0:
             self.pulse = max(0.0, self.pulse - dt * 0.02)
 
     def draw(self, surf):
@@ -167,9 +289,59 @@ class IconButton:
     def clicked(self, mouse_pos):
         return self.rect.colliderect(pg.Rect(mouse_pos[0]-1, mouse_pos[1]-1, 2, 2))
 
+class Enemy:
+    """Pooled enemy slot; spawn() rewrites the fields of an inactive slot."""
+    __slots__ = ('rect', 'lane', 'speed', 'passed', 'fresh', 'active')
+
+    def __init__(self):
+        self.rect = pg.Rect(0, -9999, ENEMY_W, ENEMY_H)
+        self.lane = -1
+        self.speed = 0.0
+        self.passed = False
+        self.fresh = False
+        self.active = False
+
+class Floater:
+    """Score popup; the text surface is rendered once at spawn."""
+    __slots__ = ('x', 'y', 'vy', 'life', 'surf')
+
+    def __init__(self, surf, x, y):
+        self.surf = surf
+        self.x = x
+        self.y = y
+        self.vy = -0.3
+        self.life = 900
+
 # --- Main game function (entry point) ---
 def run_game(username, user_id, selected_car, difficulty):
+    # Restart used to tear down SDL (pg.quit), sleep and tail-call run_game
+    # recursively — growing the Python stack each restart and re-initializing
+    # display/font/mixer plus re-decoding every asset. Looping here instead
+    # re-enters with the display and the surface caches still warm;
+    # _run_once resets all per-run state itself.
+    #
+    # Font handles (and the text surfaces keyed by their ids) do not
+    # survive the pg.quit() that ended any previous session, so those two
+    # caches start fresh per outer call; restarts inside the loop keep
+    # pygame alive and reuse them. The same applies to the music the dead
+    # mixer had loaded.
+    global _music_path
+    _music_path = None
+    _font_cache.clear()
+    _text_cache.clear()
+    while _run_once(username, user_id, selected_car, difficulty) == "restart":
+        pass
+
+
+def _run_once(username, user_id, selected_car, difficulty):
     pg.init()
+    # Every event loop in here acts only on these three types; block the rest
+    # at the SDL layer so MOUSEMOTION spam (hundreds/frame on high-Hz mice)
+    # never allocates Python event objects or fills the queue. Hover effects
+    # poll pg.mouse.get_pos() instead. The pause overlay re-allows
+    # motion/up events for its volume slider.
+    pg.event.set_blocked(None)
+    pg.event.set_allowed((pg.QUIT, pg.KEYDOWN, pg.MOUSEBUTTONDOWN))
     cfg = load_config()
     music_on = bool(cfg.get("music_on", True))
     music_volume = float(cfg.get("music_volume", 0.6))
@@ -182,14 +354,19 @@ def run_game(username, user_id, selected_car, difficulty):
     except Exception:
         mixer_ok = False
 
-    # Load and play music if available
+    # Load and play music if available. _music_path remembers what is loaded
+    # in the live mixer, so in-session restarts skip re-decoding the mp3.
+    global _music_path
     music_loaded = False
     if mixer_ok:
         for candidate in ("bgmusicgame.mp3", "bg_game.mp3", "bgmusic.mp3", "menu_music.mp3"):
             mpath = ASSETS / candidate
             if mpath.exists():
                 try:
-                    pg.mixer.music.load(str(mpath))
+                    p = str(mpath)
+                    if _music_path != p:
+                        pg.mixer.music.load(p)
+                        _music_path = p
                     pg.mixer.music.set_volume(music_volume)
                     music_loaded = True
                     if music_on:
@@ -216,29 +393,54 @@ def run_game(username, user_id, selected_car, difficulty):
     }
     enemy_img = load_image("enemy.png", ENEMY_W, ENEMY_H)
 
+    # fblits (pygame >= 2.1.4) batches every enemy blit into one C call; the
+    # sequence list is reused each frame rather than reallocated.
+    fblits = getattr(screen, 'fblits', None)
+    enemy_blit_seq = []
+
     # Select player image, fallback to player1 if unknown
     sel_name = Path(selected_car).name if selected_car else 'player1.png'
     player_img = player_imgs.get(sel_name) or player_imgs.get('player1.png')
 
-    # Build masks when possible
-    try:
-        player_mask = pg.mask.from_surface(player_img)
-    except Exception:
-        player_mask = None
-    try:
-        enemy_mask = pg.mask.from_surface(enemy_img)
-    except Exception:
-        enemy_mask = None
+    # Tight hit rects: the sprites' opaque bounding boxes, as offsets into
+    # each sprite. The narrow phase is then one colliderect on two moved
+    # rects instead of a mask bit-scan.
+    player_hit_off = player_img.get_bounding_rect()
+    enemy_hit_off = enemy_img.get_bounding_rect()
+
+    # Build masks only for the pixel-perfect debug path
+    player_mask = enemy_mask = None
+    if MASK_COLLISION:
+        try:
+            player_mask = pg.mask.from_surface(player_img)
+        except Exception:
+            player_mask = None
+        try:
+            enemy_mask = pg.mask.from_surface(enemy_img)
+        except Exception:
+            enemy_mask = None
 
     # Lane layout
     road_w = road.get_width()
     road_h = road.get_height()
     road_left = (SCREEN_W - road_w) // 2
+
+    # Pre-tile the road into one strip tall enough to cover the screen from
+    # any scroll offset, so the per-frame background is a single blit instead
+    # of a fill plus a Python tiling loop.
+    strip_tiles = SCREEN_H // road_h + 2
+    road_strip = pg.Surface((road_w, road_h * strip_tiles))
+    for i in range(strip_tiles):
+        road_strip.blit(road, (0, i * road_h), None, SPRITE_FLAGS)
     LANE_X = []
     for i in range(LANES):
         frac = (i * 2 + 1) / (LANES * 2)
         center_x = road_left + int(frac * road_w)
         LANE_X.append(center_x - PLAYER_W // 2)
+    LANE_X = tuple(LANE_X)  # indexed on every spawn and lane change
+    # Enemy center-x is fixed per lane, so the pass-scoring distance check
+    # reads this table instead of recomputing rect.x + ENEMY_W/2 per enemy.
+    LANE_CENTERS = tuple(lx + ENEMY_W // 2 for lx in LANE_X)
 
     cfg_diff = DIFF.get(difficulty, DIFF['Casual'])
     spawn_ms_base = cfg_diff['spawn_ms']
@@ -246,9 +448,24 @@ def run_game(username, user_id, selected_car, difficulty):
     spawn_max = cfg_diff['max']
     base_scroll = cfg_diff['scroll']
     MAX_ENEMIES = cfg_diff['max_enemies']
-
-    font = pg.font.SysFont('Segoe UI', 18)
-    big_font = pg.font.SysFont('Segoe UI', 40, bold=True)
+    scroll_push = base_scroll * 0.15  # extra per-frame y advance, constant per run
+    particle_drift = base_scroll * 0.02  # particle scroll_effect, constant per run
+
+    font = get_font(18)
+    big_font = get_font(40, bold=True)
+
+    # Pre-rendered particle sprites, one per (radius, alpha bucket): blitting
+    # a cached surface replaces rasterizing a circle per particle per frame.
+    # Alpha runs 0..180, quantized to 16-wide buckets (alpha >> 4 -> 0..11).
+    particle_sprites = {}
+    for psize in (1, 2, 3):
+        buckets = []
+        for b in range(12):
+            spr = pg.Surface((psize * 2 + 2, psize * 2 + 2), pg.SRCALPHA)
+            pg.draw.circle(spr, rgba(ACCENT, min(180, b * 16 + 8)), (psize + 1, psize + 1), psize)
+            buckets.append(spr)
+        particle_sprites[psize] = buckets
+    particle_seq = []
 
     particles = []
     floating = []
@@ -262,39 +479,65 @@ def run_game(username, user_id, selected_car, difficulty):
         life = rnd.uniform(2.0, 4.0)
         particles.append([x, y, vx, vy, size, life])
 
+    popup_font = get_font(20, bold=True)  # shared by every popup
+
     def spawn_popup(text, x, y):
-        f = pg.font.SysFont('Segoe UI', 20, bold=True)
-        floating.append({'txt': text, 'x': x, 'y': y, 'vy': -0.3, 'life': 900, 'alpha': 255, 'font': f})
+        floating.append(Floater(render_text(popup_font, text, ACCENT), x, y))
 
     def update_particles_and_floating(dt, surf, scroll_effect=0.0):
-        for p in particles[:]:
+        # Walk backwards with swap-pop compaction: dead particles are
+        # replaced by the list tail in O(1), so no particles[:] copy and no
+        # O(n) list.remove per death. Draw order is irrelevant here.
+        # The dt-derived scale factors are identical for every particle, so
+        # they are folded once here rather than re-multiplied per element.
+        drift = dt * 0.05
+        decay = dt * 0.001
+        i = len(particles) - 1
+        while i >= 0:
+            p = particles[i]
             p[1] += p[4] * (p[3] + scroll_effect)
-            p[0] += p[2] * dt * 0.05
-            p[5] -= dt * 0.001
-            alpha = max(0, min(180, int(180 * (p[5] / 4.0))))
-            color = rgba(ACCENT, alpha)
-            pg.draw.circle(surf, color, (int(p[0]), int(p[1])), p[4])
+            p[0] += p[2] * drift
+            p[5] -= decay
             if p[1] > SCREEN_H + 20 or p[5] <= 0:
-                try: particles.remove(p)
-                except ValueError: pass
-
-        for f in floating[:]:
-            f['y'] += f['vy'] * (dt * 0.06)
-            f['life'] -= dt
-            if f['life'] < 0:
-                try: floating.remove(f)
-                except ValueError: pass
-                continue
-            surf_txt = f['font'].render(f['txt'], True, ACCENT)
-            surf.blit(pg.transform.smoothscale(surf_txt, surf_txt.get_size()), (f['x'] - surf_txt.get_width()//2 + 1, int(f['y']) + 1))
-            surf.blit(surf_txt, (f['x'] - surf_txt.get_width()//2, int(f['y'])))
+                particles[i] = particles[-1]
+                particles.pop()
+            else:
+                alpha = max(0, min(180, int(180 * (p[5] / 4.0))))
+                spr = particle_sprites[p[4]][alpha >> 4]
+                particle_seq.append((spr, (int(p[0]) - p[4] - 1, int(p[1]) - p[4] - 1)))
+            i -= 1
+
+        if particle_seq:
+            if fblits is not None:
+                surf.fblits(particle_seq)
+            else:
+                surf.blits(particle_seq)
+            particle_seq.clear()
+
+        # Same swap-pop treatment as the particles: no floating[:] copy and
+        # no O(n) list.remove per expired popup.
+        fall = dt * 0.06
+        i = len(floating) - 1
+        while i >= 0:
+            f = floating[i]
+            f.y += f.vy * fall
+            f.life -= dt
+            if f.life < 0:
+                floating[i] = floating[-1]
+                floating.pop()
+            else:
+                s = f.surf  # rendered once at spawn
+                half_w = s.get_width() // 2
+                surf.blit(s, (f.x - half_w + 1, int(f.y) + 1))
+                surf.blit(s, (f.x - half_w, int(f.y)))
+            i -= 1
 
     # Menu buttons
     menu_labels = ["Start Game", "Leaderboards", "Help", "Quit"]
     menu_buttons = []
     btn_w, btn_h = 260, 48
     cx = SCREEN_W // 2
-    menu_font = pg.font.SysFont('Segoe UI', 22, bold=True)
+    menu_font = get_font(22, bold=True)
     for i, lbl in enumerate(menu_labels):
         y = 260 + i * 64
         menu_buttons.append(Button((cx - btn_w//2, y, btn_w, btn_h), lbl, menu_font))
@@ -304,22 +547,28 @@ def run_game(username, user_id, selected_car, difficulty):
     icon_y = 10
     pause_btn = IconButton((left_x, icon_y, icon_w, icon_w), 'pause', draw_bg=False)
 
+    # Title surfaces: the text never changes, so the three slightly upscaled
+    # glow layers are smoothscaled once here instead of every menu frame.
+    title_s = render_text(big_font, "CAR DODGER", (240,240,240))
+    _glow = render_text(big_font, "CAR DODGER", ACCENT)
+    title_glows = []
+    for i in range(3):
+        scale_w = int(_glow.get_width() * (1.0 + 0.01 * (i+1)))
+        scale_h = int(_glow.get_height() * (1.0 + 0.01 * (i+1)))
+        try:
+            glow_s = pg.transform.smoothscale(_glow, (scale_w, scale_h))
+        except Exception:
+            glow_s = _glow
+        title_glows.append((glow_s, (SCREEN_W//2 - glow_s.get_width()//2 - 1, 108 - 1)))
+
     def draw_menu(dt):
         mouse_pos = pg.mouse.get_pos()
         screen.fill(DARK_BG)
-        title_s = big_font.render("CAR DODGER", True, (240,240,240))
-        glow = big_font.render("CAR DODGER", True, ACCENT)
-        for i in range(3):
-            scale_w = int(glow.get_width() * (1.0 + 0.01 * (i+1)))
-            scale_h = int(glow.get_height() * (1.0 + 0.01 * (i+1)))
-            try:
-                glow_s = pg.transform.smoothscale(glow, (scale_w, scale_h))
-                screen.blit(glow_s, (SCREEN_W//2 - glow_s.get_width()//2 - 1, 108 - 1))
-            except Exception:
-                screen.blit(glow, (SCREEN_W//2 - glow.get_width()//2 - 1, 108 - 1))
+        for glow_s, glow_pos in title_glows:
+            screen.blit(glow_s, glow_pos)
 
         screen.blit(title_s, (SCREEN_W//2 - title_s.get_width()//2, 110))
-        sub = font.render(f"Player: {username}", True, MUTED)
+        sub = render_text(font, f"Player: {username}", MUTED)
         screen.blit(sub, (SCREEN_W//2 - sub.get_width()//2, 165))
 
         if rnd.random() < 0.08:
@@ -347,42 +596,71 @@ def run_game(username, user_id, selected_car, difficulty):
         if cur: lines.append(cur)
         return lines
 
+    # Built lazily on first Help open and reused for the rest of the run:
+    # the text is static, so wrapping (font.size per word) and line
+    # rendering need not repeat per open, let alone per frame.
+    help_cache = {}
+
     def show_help_screen():
         # Simple overlay help screen
         running_help = True
-        sections = [
-            ("Controls:", ["- Left / A  : Move left", "- Right / D : Move right", "- P or Pause: Pause / Resume", "- L         : Leaderboards (in-game)", "- Esc       : Close overlays / Menu",]),
-            ("Gameplay:", ["Avoid enemy cars. Collisions cause Game Over.", "Points: Close pass +250, Regular pass +150",]),
-            ("Tips:", ["Stay centered to give yourself escape lanes.", "Use short quick lane changes rather than holding.",])
-        ]
-
-        title_f = pg.font.SysFont('Segoe UI', 32, bold=True)
-        body_f = pg.font.SysFont('Segoe UI', 18)
-
-        box_w = 440
-        inner_w = box_w - 44
-
-        wrapped = []
-        for hdr, lines in sections:
-            wrapped.append((True, hdr))
-            for ln in lines:
-                for sub_ln in wrap_text(ln, body_f, inner_w):
-                    wrapped.append((False, sub_ln))
-            wrapped.append((False, ""))
-
-        line_h = body_f.get_linesize()
-        title_h = title_f.get_linesize()
-        padding = 22
-        content_h = title_h + 10 + len(wrapped) * line_h
-        box_h = min(520, content_h + padding * 2)
-        bx = SCREEN_W // 2 - box_w // 2
-        by = SCREEN_H // 2 - box_h // 2
-
-        close_btn = IconButton((bx + box_w - 36 - 12, by + 12, 36, 36), 'close', draw_bg=False)
-        hint_text = body_f.render("Press Esc or Close to dismiss", True, (200,200,200))
+        if not help_cache:
+            sections = [
+                ("Controls:", ["- Left / A  : Move left", "- Right / D : Move right", "- P or Pause: Pause / Resume", "- L         : Leaderboards (in-game)", "- Esc       : Close overlays / Menu",]),
+                ("Gameplay:", ["Avoid enemy cars. Collisions cause Game Over.", "Points: Close pass +250, Regular pass +150",]),
+                ("Tips:", ["Stay centered to give yourself escape lanes.", "Use short quick lane changes rather than holding.",])
+            ]
+
+            title_f = get_font(32, bold=True)
+            body_f = get_font(18)
+
+            box_w = 440
+            inner_w = box_w - 44
+
+            wrapped = []
+            for hdr, lines in sections:
+                wrapped.append((True, hdr))
+                for ln in lines:
+                    for sub_ln in wrap_text(ln, body_f, inner_w):
+                        wrapped.append((False, sub_ln))
+                wrapped.append((False, ""))
+
+            line_h = body_f.get_linesize()
+            title_h = title_f.get_linesize()
+            padding = 22
+            content_h = title_h + 10 + len(wrapped) * line_h
+            box_h = min(520, content_h + padding * 2)
+            bx = SCREEN_W // 2 - box_w // 2
+            by = SCREEN_H // 2 - box_h // 2
+
+            # Every line rendered once; the frame loop is pure blits.
+            line_surfs = []
+            for is_header, txt in wrapped:
+                if not txt:
+                    line_surfs.append(None)
+                elif is_header:
+                    line_surfs.append((render_text(body_f, txt, (220,220,220)), 22))
+                else:
+                    line_surfs.append((render_text(body_f, txt, (200,200,200)), 28))
+
+            help_cache.update(
+                box_w=box_w, box_h=box_h, bx=bx, by=by, line_h=line_h,
+                title_s=render_text(title_f, "Help & Controls", ACCENT),
+                line_surfs=line_surfs,
+                hint_text=render_text(body_f, "Press Esc or Close to dismiss", (200,200,200)),
+                close_btn=IconButton((bx + box_w - 36 - 12, by + 12, 36, 36), 'close', draw_bg=False),
+            )
+
+        box_w = help_cache['box_w']; box_h = help_cache['box_h']
+        bx = help_cache['bx']; by = help_cache['by']
+        line_h = help_cache['line_h']
+        title_s = help_cache['title_s']
+        line_surfs = help_cache['line_surfs']
+        hint_text = help_cache['hint_text']
+        close_btn = help_cache['close_btn']
 
         while running_help:
-            dt = clock.tick(FPS)
+            dt = clock.tick(MENU_FPS)
             mouse_pos = pg.mouse.get_pos()
             for ev in pg.event.get():
                 if ev.type == pg.QUIT:
@@ -396,26 +674,19 @@ def run_game(username, user_id, selected_car, difficulty):
                     elif not (bx <= mx <= bx + box_w and by <= my <= by + box_h):
                         running_help = False
 
-            overlay = pg.Surface((SCREEN_W, SCREEN_H), pg.SRCALPHA)
-            overlay.fill((0,0,0,160))
-            screen.blit(overlay, (0, 0))
+            screen.blit(get_dim_overlay(), (0, 0))
 
             pg.draw.rect(screen, DARK_PANEL, (bx, by, box_w, box_h), border_radius=12)
             pg.draw.rect(screen, (30,30,30), (bx+8, by+8, box_w-16, box_h-16), border_radius=10)
 
-            title_s = title_f.render("Help & Controls", True, ACCENT)
             screen.blit(title_s, (bx + 22, by + 18))
 
             hy = by + 18 + title_s.get_height() + 10
-            for is_header, txt in wrapped:
-                if is_header:
-                    hdr_s = body_f.render(txt, True, (220,220,220))
-                    screen.blit(hdr_s, (bx + 22, hy))
-                    hy += line_h
-                else:
-                    ln_s = body_f.render(txt, True, (200,200,200))
-                    screen.blit(ln_s, (bx + 28, hy))
-                    hy += line_h
+            for entry in line_surfs:
+                if entry is not None:
+                    ln_s, indent = entry
+                    screen.blit(ln_s, (bx + indent, hy))
+                hy += line_h
 
             close_btn.update(mouse_pos, dt)
             close_btn.draw(screen)
@@ -426,17 +697,60 @@ def run_game(username, user_id, selected_car, difficulty):
         return 'back'
 
     def show_leaderboard_screen():
+        # Push any scores queued this session so the fetch below sees them;
+        # the game-over view, the in-game L key, and the main menu all land here.
+        flush_scores()
         modes = [("All", None), ("Casual", "Casual"), ("Heroic", "Heroic"), ("Nightmare", "Nightmare")]
         selected = 0
         rows = db.top_scores(limit=15, mode=None, distinct=True)
         btn_w = 110; btn_h = 34; margin = 12
         start_x = (SCREEN_W - (btn_w * len(modes) + margin*(len(modes)-1))) // 2
         btn_rects = [pg.Rect(start_x + i*(btn_w+margin), 70, btn_w, btn_h) for i in range(len(modes))]
+        # The mode tabs only vary by which one is selected, so each is baked
+        # once as a normal and a selected panel (fill + outline + label);
+        # the frame loop then blits panels instead of re-running rounded-rect
+        # fills and centering math.
+        btn_panels = []
+        for i in range(len(modes)):
+            label = render_text(font, modes[i][0], WHITE)
+            lx = (btn_w - label.get_width()) // 2
+            ly = (btn_h - label.get_height()) // 2
+            normal = pg.Surface((btn_w, btn_h), pg.SRCALPHA)
+            pg.draw.rect(normal, DARK_PANEL, (0, 0, btn_w, btn_h), border_radius=8)
+            normal.blit(label, (lx, ly))
+            sel = pg.Surface((btn_w + 8, btn_h + 8), pg.SRCALPHA)
+            pg.draw.rect(sel, (12, 50, 56), (4, 4, btn_w, btn_h), border_radius=8)
+            pg.draw.rect(sel, ACCENT, (2, 2, btn_w + 4, btn_h + 4), 2, border_radius=10)
+            sel.blit(label, (lx + 4, ly + 4))
+            btn_panels.append((normal, sel))
         back_btn = Button((SCREEN_W - 110, 16, 92, 32), "Back", font)
 
+        def build_table(rows):
+            # Rows only change on a mode switch, so the whole table (header +
+            # up to 15 lines, or the empty notice) is composed into one
+            # surface per fetch; the frame loop blits it in a single call.
+            table = pg.Surface((SCREEN_W, 28 + 15 * 26), pg.SRCALPHA)
+            if not rows:
+                txt = render_text(font, "No scores yet. Play to create high scores!", (200,200,200))
+                table.blit(txt, (SCREEN_W//2 - txt.get_width()//2, 0))
+                return table
+            header = render_text(font, f"{'Rank':<6}{'Player':<18}{'Score':>8}{'Mode':>10}{'Date':>12}", (200,200,200))
+            table.blit(header, (28, 0))
+            y = 28
+            rank = 1
+            for uname, sc, mode, created in rows:
+                date_only = (created or '')[:10]
+                mode_text = mode if mode else '-'
+                uname_disp = uname if len(uname) <= 16 else uname[:13] + '...'
+                line_text = f"{rank:<6}{uname_disp:<18}{sc:>8}{mode_text:>10}{date_only:>12}"
+                table.blit(render_text(font, line_text, (220,220,220)), (28, y))
+                y += 26; rank += 1
+            return table
+
+        table_surf = build_table(rows)
         running_lb = True
         while running_lb:
-            dt = clock.tick(FPS)
+            dt = clock.tick(MENU_FPS)
             mouse_pos = pg.mouse.get_pos()
             for ev in pg.event.get():
                 if ev.type == pg.QUIT:
@@ -452,82 +766,105 @@ def run_game(username, user_id, selected_car, difficulty):
                                 selected = i
                                 mode_name = modes[selected][1]
                                 rows = db.top_scores(limit=15, mode=mode_name, distinct=True)
+                                table_surf = build_table(rows)
                             break
                     if back_btn.clicked((mx, my)):
                         running_lb = False
 
             screen.fill((0,0,0))
-            title = big_font.render("Leaderboards", True, (250,200,70))
+            title = render_text(big_font, "Leaderboards", (250,200,70))
             screen.blit(title, (SCREEN_W//2 - title.get_width()//2, 16))
 
             for i, r in enumerate(btn_rects):
-                is_sel = (i == selected)
-                col = DARK_PANEL if not is_sel else (12,50,56)
-                pg.draw.rect(screen, col, r, border_radius=8)
-                txt = font.render(modes[i][0], True, WHITE)
-                screen.blit(txt, (r.centerx - txt.get_width()//2, r.centery - txt.get_height()//2))
-                if is_sel:
-                    pg.draw.rect(screen, ACCENT, (r.x-2, r.y-2, r.w+4, r.h+4), 2, border_radius=10)
+                if i == selected:
+                    screen.blit(btn_panels[i][1], (r.x - 4, r.y - 4))
+                else:
+                    screen.blit(btn_panels[i][0], r)
 
             back_btn.update(mouse_pos, dt)
             back_btn.draw(screen)
 
-            y = 130
-            if not rows:
-                txt = font.render("No scores yet. Play to create high scores!", True, (200,200,200))
-                screen.blit(txt, (SCREEN_W//2 - txt.get_width()//2, y))
-            else:
-                header = font.render(f"{'Rank':<6}{'Player':<18}{'Score':>8}{'Mode':>10}{'Date':>12}", True, (200,200,200))
-                screen.blit(header, (28, y)); y += 28
-                rank = 1
-                for r in rows:
-                    uname, sc, mode, created = r
-                    date_only = (created or '')[:10]
-                    mode_text = mode if mode else '-'
-                    uname_disp = uname if len(uname) <= 16 else uname[:13] + '...'
-                    line_text = f"{rank:<6}{uname_disp:<18}{sc:>8}{mode_text:>10}{date_only:>12}"
-                    line = font.render(line_text, True, (220,220,220))
-                    screen.blit(line, (28, y)); y += 26; rank += 1
-
-            hint = font.render("Esc/Enter to close | Click mode buttons to switch", True, (150,150,150))
+            screen.blit(table_surf, (0, 130))
+
+            hint = render_text(font, "Esc/Enter to close | Click mode buttons to switch", (150,150,150))
             screen.blit(hint, (SCREEN_W//2 - hint.get_width()//2, SCREEN_H - 40))
             pg.display.flip()
         return 'back'
 
     # Gameplay state
     score = 0
-    enemies = []
-    last_spawn = pg.time.get_ticks()
+    # Fixed pool of enemy slots: Rects and dicts are allocated once here and
+    # rewritten in place on spawn/despawn, so the gameplay loop never churns
+    # the allocator with fresh enemy objects.
+    enemies = [Enemy() for _ in range(MAX_ENEMIES)]
+    # One (image, rect) pair per slot, built once: the rects are mutated in
+    # place, so the draw loop reuses these instead of allocating a fresh
+    # tuple per enemy per frame.
+    enemy_pairs = [(enemy_img, e.rect) for e in enemies]
+    active_enemies = 0
+    MIN_GAP = 140  # an enemy above this y still blocks its lane for spawns
+    lanes_near_top = 0  # bitmask kept in sync incrementally (see spawn)
+    # Spawn timing rides the dt already returned by clock.tick instead of
+    # polling pg.time.get_ticks() (an SDL timer read) every frame.
+    spawn_accum = 0
     spawn_ms = spawn_ms_base
-    offset = 0.0
+    # Scroll offset kept in Q8 fixed point (units of 1/256 px) so the
+    # per-frame advance stays in CPython's small-int fast path instead of
+    # allocating boxed floats 60 times a second.
+    offset_q8 = 0
+    road_span_q8 = max(1, road_h) << 8
+    scroll_q8_per_ms = round(base_scroll * 256 / 16.67)
 
     cur_lane = 1
     target_x = LANE_X[cur_lane]
     player_rect = pg.Rect(target_x, SCREEN_H - PLAYER_H - 20, PLAYER_W, PLAYER_H)
+    player_x = float(target_x)  # true position; Rect.x truncates to int
+    # The player's drop shadow never changes size or color; build it once
+    # instead of allocating + alpha-filling a fresh surface every frame.
+    shadow_surf = pg.Surface((PLAYER_W, 10), pg.SRCALPHA)
+    shadow_surf.fill((0, 0, 0, 80))
     lane_change_speed = 12.0
+    lane_step_per_ms = lane_change_speed * 0.06  # px per ms of lane interpolation
     paused = False
 
     def spawn():
-        if len(enemies) >= MAX_ENEMIES:
+        nonlocal active_enemies, lanes_near_top
+        if active_enemies >= MAX_ENEMIES:
+            return
+        slot = None
+        for e in enemies:
+            if not e.active:
+                slot = e
+                break
+        if slot is None:
+            return
+        free = MASK_TO_LANES[LANE_MASK_ALL & ~lanes_near_top]
+        if not free:
             return
-        min_gap = 140
-        candidate_lanes = list(range(LANES))
-        rnd.shuffle(candidate_lanes)
-        for lane in candidate_lanes:
-            conflict = any(e['lane'] == lane and e['rect'].y < min_gap for e in enemies)
-            if not conflict:
-                x = LANE_X[lane]
-                y = -ENEMY_H - rnd.randint(0, 180)
-                speed = rnd.uniform(spawn_min, spawn_max)
-                rect = pg.Rect(x, y, ENEMY_W, ENEMY_H)
-                enemies.append({'rect': rect, 'lane': lane, 'speed': speed, 'passed': False})
-                return
+        lane = rnd.choice(free)
+        slot.rect.x = LANE_X[lane]
+        slot.rect.y = -ENEMY_H - rnd.randint(0, 180)
+        slot.lane = lane
+        slot.speed = rnd.uniform(spawn_min, spawn_max)
+        slot.passed = False
+        slot.fresh = True
+        slot.active = True
+        lanes_near_top |= 1 << lane
+        active_enemies += 1
+
+    # HUD text barely changes: the mode label is fixed for the whole run and
+    # the score only moves on pass events, so re-render only on change
+    # instead of hitting FreeType 60 times a second.
+    mode_surf = font.render(f"Mode: {difficulty}", True, (200,200,200))
+    mode_pos = (SCREEN_W - mode_surf.get_width() - 10, 10)
+    hud_cache = {'score': None, 'surf': None}
 
     def draw_hud(dt):
-        scr = font.render(f"Score: {score}", True, ACCENT)
-        screen.blit(scr, (10,10))
-        mode = font.render(f"Mode: {difficulty}", True, (200,200,200))
-        screen.blit(mode, (SCREEN_W - mode.get_width() - 10, 10))
+        if hud_cache['score'] != score:
+            hud_cache['score'] = score
+            hud_cache['surf'] = font.render(f"Score: {score}", True, ACCENT)
+        screen.blit(hud_cache['surf'], (10,10))
+        screen.blit(mode_surf, mode_pos)
         mouse_pos = pg.mouse.get_pos()
         pause_btn.update(mouse_pos, dt)
         pause_btn.draw(screen)
@@ -541,9 +878,9 @@ def run_game(username, user_id, selected_car, difficulty):
                 if mixer_ok:
                     try: pg.mixer.music.stop(); pg.mixer.quit()
                     except Exception: pass
-                pg.quit(); return
+                flush_scores(); pg.quit(); return
             if ev.type == pg.MOUSEBUTTONDOWN and ev.button == 1:
-                mpos = pg.mouse.get_pos()
+                mpos = ev.pos  # the event already carries the click position
                 for b in menu_buttons:
                     if b.clicked(mpos):
                         lbl = b.text
@@ -555,14 +892,14 @@ def run_game(username, user_id, selected_car, difficulty):
                                 if mixer_ok:
                                     try: pg.mixer.music.stop(); pg.mixer.quit()
                                     except Exception: pass
-                                pg.quit(); return
+                                flush_scores(); pg.quit(); return
                         elif lbl == "Help":
                             show_help_screen()
                         elif lbl == "Quit":
                             if mixer_ok:
                                 try: pg.mixer.music.stop(); pg.mixer.quit()
                                 except Exception: pass
-                            pg.quit(); return
+                            flush_scores(); pg.quit(); return
             if ev.type == pg.KEYDOWN:
                 if ev.key in (pg.K_RETURN,):
                     in_menu = False
@@ -570,10 +907,17 @@ def run_game(username, user_id, selected_car, difficulty):
         draw_menu(dt)
 
     # --- Main gameplay loop ---
+    # Bind names the 60 Hz loop touches every frame to locals: LOAD_FAST is
+    # cheaper than the LOAD_GLOBAL/LOAD_DEREF these would otherwise compile to.
+    event_get = pg.event.get
+    despawn_y = SCREEN_H + 200
+    enemy_h = ENEMY_H
+    close_thresh = CLOSE_THRESH
+
     running = True
     while running:
         dt = clock.tick(FPS)
-        for ev in pg.event.get():
+        for ev in event_get():
             if ev.type == pg.QUIT:
                 running = False
             if ev.type == pg.KEYDOWN:
@@ -599,6 +943,7 @@ def run_game(username, user_id, selected_car, difficulty):
 
         # --- Pause overlay ---
         if paused:
+            pg.event.set_allowed((pg.MOUSEMOTION, pg.MOUSEBUTTONUP))
             slider_drag = False
             vol = cfg.get('music_volume', music_volume)
             music_enabled = cfg.get('music_on', True)
@@ -610,6 +955,9 @@ def run_game(username, user_id, selected_car, difficulty):
             help_b   = Button((left_x, SCREEN_H//2 + 52, bw, bh), "Help", font)
             quit_b   = Button((left_x, SCREEN_H//2 + 110,bw, bh), "Quit", font)
 
+            pause_overlay = pg.Surface((SCREEN_W, SCREEN_H), pg.SRCALPHA)
+            pause_overlay.fill((0, 0, 0, 200))
+
             panel_x = SCREEN_W//2 + 8
             panel_w = SCREEN_W - panel_x - 16
             panel_y = SCREEN_H//2 - 120
@@ -618,16 +966,19 @@ def run_game(username, user_id, selected_car, difficulty):
             s_w = panel_w - 36
             s_h = 12
 
+            cfg_dirty = False  # coalesce slider/keyboard writes; flushed below
             while paused:
-                dt_p = clock.tick(FPS)
+                dt_p = clock.tick(MENU_FPS)
                 mx, my = pg.mouse.get_pos()
 
                 for ev2 in pg.event.get():
                     if ev2.type == pg.QUIT:
+                        if cfg_dirty:
+                            save_config(cfg)
                         if mixer_ok:
                             try: pg.mixer.music.stop(); pg.mixer.quit()
                             except Exception: pass
-                        pg.quit(); return
+                        flush_scores(); pg.quit(); return
                     if ev2.type == pg.KEYDOWN:
                         if ev2.key in (pg.K_RETURN, pg.K_p):
                             paused = False; break
@@ -640,7 +991,7 @@ def run_game(username, user_id, selected_car, difficulty):
                             if mixer_ok and music_loaded:
                                 try: pg.mixer.music.set_volume(vol if cfg.get('music_on', True) else 0.0)
                                 except Exception: pass
-                            save_config(cfg)
+                            cfg_dirty = True
                         if ev2.key == pg.K_RIGHT:
                             vol = min(1.0, vol + 0.05)
                             cfg['music_volume'] = vol
@@ -648,7 +999,7 @@ def run_game(username, user_id, selected_car, difficulty):
                             if mixer_ok and music_loaded:
                                 try: pg.mixer.music.set_volume(vol if cfg.get('music_on', True) else 0.0)
                                 except Exception: pass
-                            save_config(cfg)
+                            cfg_dirty = True
 
                     if ev2.type == pg.MOUSEBUTTONDOWN and ev2.button == 1:
                         if resume_b.clicked((mx, my)):
@@ -669,7 +1020,7 @@ def run_game(username, user_id, selected_car, difficulty):
                             if mixer_ok and music_loaded:
                                 try: pg.mixer.music.set_volume(vol if cfg.get('music_on', True) else 0.0)
                                 except Exception: pass
-                            save_config(cfg)
+                            cfg_dirty = True
 
                         toggle_rect = pg.Rect(panel_x + 18, panel_y + 105, 120, 28)
                         if toggle_rect.collidepoint(mx, my):
@@ -685,9 +1036,12 @@ def run_game(username, user_id, selected_car, difficulty):
                                         pg.mixer.music.set_volume(0.0)
                                 except Exception:
                                     pass
-                            save_config(cfg)
+                            cfg_dirty = True
 
                     if ev2.type == pg.MOUSEBUTTONUP and ev2.button == 1:
+                        if slider_drag and cfg_dirty:
+                            save_config(cfg)  # flush once at drag end
+                            cfg_dirty = False
                         slider_drag = False
 
                     if ev2.type == pg.MOUSEMOTION and slider_drag:
@@ -698,12 +1052,10 @@ def run_game(username, user_id, selected_car, difficulty):
                         if mixer_ok and music_loaded:
                             try: pg.mixer.music.set_volume(vol if cfg.get('music_on', True) else 0.0)
                             except Exception: pass
-                        save_config(cfg)
+                        cfg_dirty = True
 
-                # Draw overlay and UI
-                overlay = pg.Surface((SCREEN_W, SCREEN_H), pg.SRCALPHA)
-                overlay.fill((0,0,0,200))
-                screen.blit(overlay, (0,0))
+                # Draw overlay and UI (the dim layer is built once per pause)
+                screen.blit(pause_overlay, (0, 0))
 
                 mouse_pos = (mx, my)
                 for b in (resume_b, lb_b, help_b, quit_b):
@@ -712,63 +1064,95 @@ def run_game(username, user_id, selected_car, difficulty):
 
                 pg.draw.rect(screen, DARK_PANEL, (panel_x, panel_y + 56, panel_w, 165), border_radius=12)
                 pg.draw.rect(screen, (30,30,30), (panel_x+8, panel_y+64, panel_w-16, 149), border_radius=10)
-                title = font.render("Settings", True, ACCENT)
-                screen.blit(title, (panel_x + 18, panel_y + 68))
 
                 toggle_rect = pg.Rect(panel_x + 18, panel_y + 105, 120, 28)
                 pg.draw.rect(screen, (40,40,40), toggle_rect, border_radius=8)
-                ttxt = font.render("Music ON" if cfg.get('music_on', True) else "Music OFF", True, (230,230,230))
-                screen.blit(ttxt, (toggle_rect.x + 20, toggle_rect.y + 1))
-
-                vlbl = font.render("Volume", True, (200,200,200))
-                screen.blit(vlbl, (panel_x + 18, panel_y + 135))
                 pg.draw.rect(screen, (60,60,60), (s_x, s_y, s_w, s_h), border_radius=6)
                 fill_w = int(s_w * vol)
                 pg.draw.rect(screen, ACCENT, (s_x, s_y, fill_w, s_h), border_radius=6)
                 knob_x = s_x + fill_w
                 pg.draw.circle(screen, (220,220,220), (knob_x, s_y + s_h//2), 8)
-                vol_pct = int(vol * 100)
-                vol_txt = font.render(f"{vol_pct}%", True, (200,200,200))
-                screen.blit(vol_txt, (panel_x + 18, panel_y + 180))
 
-                hint = font.render("Enter = Resume | Esc = Quit to menu | ←/→ adjust vol", True, (160,160,160))
-                screen.blit(hint, (SCREEN_W//2 - hint.get_width()//2, panel_y + 320))
-                pause_title = big_font.render("PAUSED", True, (230,230,230))
-                screen.blit(pause_title, (SCREEN_W//2 - pause_title.get_width()//2, SCREEN_H//2 - 180))
+                # All six labels go down in one fblits call; none of them
+                # sits under a panel shape, so drawing them last is safe.
+                title = render_text(font, "Settings", ACCENT)
+                ttxt = render_text(font, "Music ON" if cfg.get('music_on', True) else "Music OFF", (230,230,230))
+                vlbl = render_text(font, "Volume", (200,200,200))
+                vol_pct = int(vol * 100)
+                vol_txt = render_text(font, f"{vol_pct}%", (200,200,200))
+                hint = render_text(font, "Enter = Resume | Esc = Quit to menu | ←/→ adjust vol", (160,160,160))
+                pause_title = render_text(big_font, "PAUSED", (230,230,230))
+                ui_blits = (
+                    (title, (panel_x + 18, panel_y + 68)),
+                    (ttxt, (toggle_rect.x + 20, toggle_rect.y + 1)),
+                    (vlbl, (panel_x + 18, panel_y + 135)),
+                    (vol_txt, (panel_x + 18, panel_y + 180)),
+                    (hint, (SCREEN_W//2 - hint.get_width()//2, panel_y + 320)),
+                    (pause_title, (SCREEN_W//2 - pause_title.get_width()//2, SCREEN_H//2 - 180)),
+                )
+                if fblits is not None:
+                    fblits(ui_blits)
+                else:
+                    for s, pos in ui_blits:
+                        screen.blit(s, pos)
 
                 pause_btn.update(mouse_pos, dt_p)
                 pause_btn.draw(screen)
 
                 pg.display.flip()
 
-            # Persist final config after unpausing
-            cfg['music_volume'] = vol
-            cfg['music_on'] = cfg.get('music_on', True) and (cfg.get('music_volume', vol) > 0.001)
-            save_config(cfg)
+            pg.event.set_blocked((pg.MOUSEMOTION, pg.MOUSEBUTTONUP))
 
-        # spawn timing
-        now = pg.time.get_ticks()
-        if now - last_spawn > spawn_ms:
+            # Persist final config after unpausing, but only if something
+            # actually changed during the pause (slider drags already flushed
+            # on release and reset the flag)
+            if cfg_dirty:
+                cfg['music_volume'] = vol
+                cfg['music_on'] = cfg.get('music_on', True) and (cfg.get('music_volume', vol) > 0.001)
+                save_config(cfg)
+
+        # spawn timing (carry the overshoot so the cadence stays drift-free)
+        spawn_accum += dt
+        if spawn_accum >= spawn_ms:
+            spawn_accum -= spawn_ms
             spawn()
-            last_spawn = now
             spawn_ms = max(200, spawn_ms_base + rnd.randint(-200, 200))
 
-        rem = []
+        # Hoist loop invariants: only e.rect.y changes per enemy, so the
+        # scroll push, the player's bottom edge and his center-x are computed
+        # once per frame instead of once per enemy.
+        player_bottom = player_rect.y + player_rect.height
+        pc = player_rect.x + PLAYER_W // 2  # int so the dist compare stays int/int
+        p_hit = player_hit_off.move(player_rect.x, player_rect.y)
         for e in enemies:
-            e['rect'].y += e['speed'] + (base_scroll * 0.15)
+            if not e.active:
+                continue
+            er = e.rect  # cached: touched several times below
+            er.y += e.speed + scroll_push
+
+            # Broad phase: pure integer compares. Only an enemy whose y-band
+            # and x-range overlap the player's can possibly collide, so the
+            # mask/Rect narrow phase below runs for at most one or two
+            # enemies per frame instead of all of them.
+            ey = er.y
+            if e.fresh and ey >= MIN_GAP:
+                # far enough down that its lane may host a new spawn
+                e.fresh = False
+                lanes_near_top &= ~(1 << e.lane)
+
+            near = (ey + enemy_h > player_rect.y and ey < player_bottom
+                    and abs(er.x - player_rect.x) < ENEMY_W)
+
             collided = False
-            if player_mask is not None and enemy_mask is not None:
-                off = (int(e['rect'].x - player_rect.x), int(e['rect'].y - player_rect.y))
+            if not near:
+                pass
+            elif player_mask is not None and enemy_mask is not None:
+                # MASK_COLLISION debug path: pixel-perfect overlap
+                off = (int(er.x - player_rect.x), int(ey - player_rect.y))
                 if player_mask.overlap(enemy_mask, off) is not None:
                     collided = True
             else:
-                SHRINK_FRACTION = 0.35
-                pw = max(1, int(player_rect.w * (1.0 - SHRINK_FRACTION)))
-                ph = max(1, int(player_rect.h * (1.0 - SHRINK_FRACTION)))
-                ew = max(1, int(e['rect'].w * (1.0 - SHRINK_FRACTION)))
-                eh = max(1, int(e['rect'].h * (1.0 - SHRINK_FRACTION)))
-                p_hit = pg.Rect(player_rect.centerx - pw//2, player_rect.centery - ph//2, pw, ph)
-                e_hit = pg.Rect(e['rect'].centerx - ew//2, e['rect'].centery - eh//2, ew, eh)
+                e_hit = enemy_hit_off.move(er.x, er.y)
                 if p_hit.colliderect(e_hit):
                     collided = True
 
@@ -776,53 +1160,50 @@ def run_game(username, user_id, selected_car, difficulty):
                 running = False
                 break
 
-            if not e['passed'] and e['rect'].y > player_rect.y + player_rect.height:
-                e['passed'] = True
-                ec = e['rect'].x + ENEMY_W/2
-                pc = player_rect.x + PLAYER_W/2
-                dist = abs(ec - pc)
-                if dist <= CLOSE_THRESH:
+            if not e.passed and ey > player_bottom:
+                e.passed = True
+                dist = abs(LANE_CENTERS[e.lane] - pc)
+                if dist <= close_thresh:
                     score += 250
                     spawn_popup("+250", pc, player_rect.y - 20)
                 else:
                     score += 150
                     spawn_popup("+150", pc, player_rect.y - 20)
 
-            if e['rect'].y > SCREEN_H + 200:
-                rem.append(e)
-
-        for r in rem:
-            try: enemies.remove(r)
-            except ValueError: pass
+            if ey > despawn_y:
+                e.active = False
+                active_enemies -= 1
 
-        # smooth lane interpolation
-        if abs(player_rect.x - target_x) > 1:
-            step = lane_change_speed * (dt * 0.06)
-            if player_rect.x < target_x:
-                player_rect.x = min(target_x, player_rect.x + step)
-            else:
-                player_rect.x = max(target_x, player_rect.x - step)
+        # smooth lane interpolation: constant-speed step clamped to the
+        # remaining gap, tracked in float so Rect.x's int truncation can't
+        # stall the car a pixel short of the lane
+        dx = target_x - player_x
+        if dx:
+            step = lane_step_per_ms * dt
+            player_x += max(-step, min(step, dx))
+            player_rect.x = int(player_x)
 
         # background scroll
-        scroll = base_scroll * (dt / 16.67)
-        offset = (offset + scroll) % max(1, road_h)
-
-        screen.fill(DARK_BG)
+        offset_q8 = (offset_q8 + scroll_q8_per_ms * dt) % road_span_q8
 
-        rx = (SCREEN_W - road.get_width()) // 2
-        ry = offset - road_h
-        while ry < SCREEN_H:
-            screen.blit(road, (rx, ry))
-            ry += road_h
+        if road_w < SCREEN_W:
+            screen.fill(DARK_BG)  # only needed when the road leaves side bands
+        screen.blit(road_strip, (road_left, (offset_q8 >> 8) - road_h))
 
-        update_particles_and_floating(dt, screen, scroll_effect=(base_scroll * 0.02))
+        update_particles_and_floating(dt, screen, scroll_effect=particle_drift)
 
-        for e in enemies:
-            screen.blit(enemy_img, (e['rect'].x, e['rect'].y))
-        shadow = pg.Surface((player_rect.w, 10), pg.SRCALPHA)
-        shadow.fill((0,0,0,80))
-        screen.blit(shadow, (player_rect.x, player_rect.y + player_rect.h - 8))
-        screen.blit(player_img, (player_rect.x, player_rect.y))
+        if fblits is not None:
+            enemy_blit_seq.clear()
+            for e, pair in zip(enemies, enemy_pairs):
+                if e.active:
+                    enemy_blit_seq.append(pair)
+            fblits(enemy_blit_seq, SPRITE_FLAGS)
+        else:
+            for e in enemies:
+                if e.active:
+                    screen.blit(enemy_img, e.rect, None, SPRITE_FLAGS)
+        screen.blit(shadow_surf, (player_rect.x, player_rect.y + player_rect.h - 8))
+        screen.blit(player_img, player_rect, None, SPRITE_FLAGS)
 
         draw_hud(dt)
 
@@ -836,7 +1217,7 @@ def run_game(username, user_id, selected_car, difficulty):
         b_menu = Button((SCREEN_W//2 + 10, SCREEN_H//2 + 80, bw, bh), "Menu", font)
 
         while True:
-            dt = clock.tick(FPS)
+            dt = clock.tick(MENU_FPS)
             mouse_pos = pg.mouse.get_pos()
             for ev in pg.event.get():
                 if ev.type == pg.QUIT: return "quit"
@@ -844,45 +1225,43 @@ def run_game(username, user_id, selected_car, difficulty):
                     if ev.key == pg.K_ESCAPE: return "menu"
                     if ev.key == pg.K_RETURN: return "restart"
                 if ev.type == pg.MOUSEBUTTONDOWN and ev.button == 1:
-                    mpos = pg.mouse.get_pos()
+                    mpos = ev.pos
                     if b_restart.clicked(mpos): return "restart"
                     if b_view.clicked(mpos): return "leaderboard"
                     if b_menu.clicked(mpos): return "menu"
 
             screen.fill((6,6,6))
-            go = big_font.render("GAME OVER", True, (255,80,80))
-            sc_txt = font.render(f"Score: {score}", True, (230,230,230))
+            go = render_text(big_font, "GAME OVER", (255,80,80))
+            sc_txt = render_text(font, f"Score: {score}", (230,230,230))
             screen.blit(go, (SCREEN_W//2 - go.get_width()//2, SCREEN_H//2 - 80))
             screen.blit(sc_txt, (SCREEN_W//2 - sc_txt.get_width()//2, SCREEN_H//2 - 20))
 
             for b in (b_restart, b_view, b_menu):
-                b.update(pg.mouse.get_pos(), dt)
+                b.update(mouse_pos, dt)
                 b.draw(screen)
 
             pg.display.flip()
 
-    # Save score if user logged in
+    # Queue score if user logged in; flushed to the DB on exit
     if user_id:
-        try:
-            save_score(user_id, score, difficulty)
-        except Exception:
-            pass
+        queue_score(user_id, score, difficulty)
 
     res = show_game_over_screen()
 
     if res == "leaderboard":
         show_leaderboard_screen()
     elif res == "restart":
+        # Leave pygame (and with it the converted-surface caches) alive;
+        # the outer loop in run_game re-enters immediately.
         if mixer_ok:
-            try: pg.mixer.music.stop(); pg.mixer.quit()
+            try: pg.mixer.music.stop()
             except Exception: pass
-        pg.quit()
-        time.sleep(0.08)
-        return run_game(username, user_id, selected_car, difficulty)
+        return "restart"
 
     if mixer_ok:
         try: pg.mixer.music.stop(); pg.mixer.quit()
         except Exception: pass
 
+    flush_scores()
     pg.quit()
     return
@@ -1,29 +1,39 @@
 # launcher.py
+import os
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox
 from PIL import Image, ImageTk
 from pathlib import Path
 import json
 import importlib
+import importlib.util
 import threading
-import time
 from pathlib import Path as _Path
 
 import subprocess, sys
 
 # --- Auto-install required modules ---
-def install_missing(pkg):
-    try:
-        __import__(pkg)
-    except ImportError:
+def install_missing(pkg, module=None):
+    """pip-install pkg if its import module is absent.
+
+    find_spec checks availability without importing, so startup does not pay
+    for loading packages it only needs later (and the pip-name/module-name
+    split matters: importing 'Pillow' always failed, which used to spawn a
+    pip subprocess on every launch).
+    """
+    if importlib.util.find_spec(module or pkg) is None:
         print(f"[Launcher] Installing missing package: {pkg}...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
 
-for lib in ["pygame", "Pillow"]:
-    install_missing(lib)
+for lib, mod in [("pygame", "pygame"), ("Pillow", "PIL")]:
+    install_missing(lib, mod)
 
-import pygame as pg_mixer
-PYGAME_AVAILABLE = True
+# pygame pulls in SDL and costs hundreds of ms; it is only needed for music,
+# so the mixer worker thread imports it off the Tk thread. None = not yet
+# attempted, True/False = attempted.
+pg_mixer = None
+PYGAME_AVAILABLE = None
 
 # Custom Import
 import db
@@ -53,16 +63,58 @@ DEFAULT_CONFIG = {
     "session_active": False
 }
 
+# static body of the Help window, built once at import
+HELP_TEXT = """Car Dodger — Help
+
+Controls:
+  - Left arrow / A : Move left one lane
+  - Right arrow / D: Move right one lane
+  - P              : Pause / Resume during gameplay
+  - L              : Open in-game Leaderboards (pauses the game)
+  - Esc            : Close menus / return to launcher menu
+  - Mouse click    : Use buttons in menus
+
+Gameplay:
+  - Avoid enemy cars. If they collide with you (pixel-perfect or central hitbox), it's game over.
+  - When an enemy passes your car, you get points:
+      * Close pass (near center): +250
+      * Regular pass: +150
+  - Difficulty affects spawn speed, enemy speed, and max enemies.
+
+Score & Leaderboards:
+  - Leaderboards are per-mode and show the best score per player.
+  - Dates shown are YYYY-MM-DD.
+  - To post scores, be logged in before starting the game.
+"""
+
+# splits "Player1" -> "Player 1" for the garage confirmation label
+_NICE_NAME_RE = re.compile(r'([A-Za-z])([0-9])')
+
 # simple scaling helper for fonts/layout
 SCALE = WIDTH/480
 
 def scaled(v):
     return max(8, int(v * SCALE))
 
-# ensure minimal filesystem setup and DB
+# Font tuples are constant once SCALE is fixed, so build them once here
+# instead of re-running scaled() in every widget constructor.
+FONT_BTN      = ('Helvetica', scaled(11), 'bold')
+FONT_HDR      = ('Orbitron', scaled(18), 'bold')
+FONT_TITLE_SM = ('Helvetica', scaled(12), 'bold')
+FONT_TITLE    = ('Helvetica', scaled(13), 'bold')
+FONT_TITLE_LG = ('Helvetica', scaled(14), 'bold')
+FONT_TITLE_XL = ('Helvetica', scaled(16), 'bold')
+FONT_START    = ('Helvetica', scaled(18), 'bold')
+FONT_TINY     = ('Arial', scaled(8))
+FONT_SMALL    = ('Arial', scaled(9))
+FONT_SMALL_B  = ('Arial', scaled(9), 'bold')
+FONT_BODY     = ('Arial', scaled(10))
+FONT_ENTRY    = ('Arial', scaled(11))
+
+# ensure minimal filesystem setup (DB schema is created in the background
+# from Launcher.__init__; it only has to finish before the first login)
 BASE_DIR.mkdir(parents=True, exist_ok=True)
 ASSETS_DIR.mkdir(parents=True, exist_ok=True)
-db.init_db()
 
 # --- config helpers ---
 def load_config():
@@ -74,52 +126,158 @@ def load_config():
     return DEFAULT_CONFIG.copy()
 
 
+_last_cfg_blob = None  # serialized form of the last successful write
+
+
 def save_config(cfg):
+    """Write config atomically: serialize to a temp file, then rename over.
+
+    os.replace is atomic on POSIX and modern Windows, so a crash mid-write
+    can no longer leave a truncated config.json behind (which load_config
+    would silently replace with the defaults, losing settings). A save whose
+    serialized form matches the last successful write is skipped entirely.
+    """
+    global _last_cfg_blob
     try:
-        CFG_FILE.write_text(json.dumps(cfg, indent=2), encoding='utf-8')
+        blob = json.dumps(cfg, separators=(',', ':'))
+        if blob == _last_cfg_blob:
+            return
+        tmp = CFG_FILE.with_suffix('.json.tmp')
+        tmp.write_text(blob, encoding='utf-8')
+        os.replace(tmp, CFG_FILE)
+        _last_cfg_blob = blob
     except Exception:
         pass
 
+# One directory scan at startup; asset lookups and the garage listing become
+# dict hits instead of per-call stat()/glob() syscalls. _scan_assets can be
+# re-run if files are dropped in while the launcher is open.
+_asset_index = {}
+
+
+def _scan_assets():
+    _asset_index.clear()
+    try:
+        _asset_index.update({p.name: p for p in ASSETS_DIR.iterdir() if p.is_file()})
+    except OSError:
+        pass
+
+
+_scan_assets()
+
+# PhotoImage cache keyed by (name, w, h). The PIL decode + Lanczos resize
+# and especially the ImageTk upload into Tk are the slow half of showing a
+# thumbnail, so each asset/size pair pays them once per process. Keeping the
+# handles referenced here also stops Tk from garbage-collecting an image out
+# from under a Label.
+_photo_cache = {}
+
+# Resized copies are kept on disk so later launches only decode a tiny PNG
+# instead of re-running Lanczos over the full-size asset.
+THUMBS_DIR = ASSETS_DIR / '.thumbs'
+
+
+def _ensure_thumb(src, w, h):
+    """Return a pre-resized w×h copy of src, regenerating it when stale.
+
+    The Lanczos resample is the expensive part of loading a thumbnail; doing
+    it once per asset/size and saving the result means every launch after the
+    first skips the convolution entirely.
+    """
+    thumb = THUMBS_DIR / f"{src.stem}_{w}x{h}.png"
+    try:
+        if thumb.exists() and thumb.stat().st_mtime >= src.stat().st_mtime:
+            return thumb
+        THUMBS_DIR.mkdir(parents=True, exist_ok=True)
+        im = Image.open(src)
+        if im.mode not in ("RGB", "RGBA"):
+            im = im.convert("RGBA")  # promote palette/greyscale; keep RGB as-is
+        im = im.resize((w, h), Image.LANCZOS)
+        im.save(thumb, optimize=True)
+        return thumb
+    except Exception:
+        return src  # fall back to resizing the original at load time
+
+
+# Decode (and resize, via the thumb cache) an asset to a PIL image. Safe to
+# call from a worker thread; only the ImageTk upload must stay on the Tk side.
+def _load_pil(name, w=None, h=None):
+    p = _asset_index.get(name)
+    if p is None:
+        # not in the startup scan; check disk once in case it was added since
+        p = ASSETS_DIR / name
+        if not p.exists():
+            return None
+        _asset_index[name] = p
+    try:
+        if w and h:
+            im = Image.open(_ensure_thumb(p, w, h))
+            if im.size != (w, h):
+                im = im.resize((w, h), Image.LANCZOS)
+        else:
+            im = Image.open(p)
+        if im.mode not in ("RGB", "RGBA"):
+            im = im.convert("RGBA")
+        return im
+    except Exception:
+        return None
+
+
 # Load an image from assets; return PhotoImage or None
 def safe_load_image(name, w=None, h=None):
-    p = ASSETS_DIR / name
-    if not p.exists():
+    key = (name, w, h)
+    img = _photo_cache.get(key)
+    if img is not None:
+        return img
+    im = _load_pil(name, w, h)
+    if im is None:
         return None
     try:
-        im = Image.open(p).convert("RGBA")
-        if w and h:
-            im = im.resize((w, h), Image.LANCZOS)
-        return ImageTk.PhotoImage(im)
+        img = ImageTk.PhotoImage(im)
     except Exception:
         return None
+    _photo_cache[key] = img
+    return img
 
 
 class DarkButton(tk.Button):
     """Small styled button used through the launcher UI."""
+
+    _class_bound = False  # hover handlers installed once on the class bindtag
+
     def __init__(self, master=None, **kw):
         kw.setdefault('bg', BTN_BG)
         kw.setdefault('activebackground', BTN_ACTIVE)
         kw.setdefault('fg', FG)
         kw.setdefault('bd', 0)
         kw.setdefault('relief', 'flat')
-        kw.setdefault('font', ('Helvetica', scaled(11), 'bold'))
+        kw.setdefault('font', FONT_BTN)
         super().__init__(master, **kw)
         self._normal_bg = kw.get('bg', BTN_BG)
         self._normal_fg = kw.get('fg', FG)
         self._hover_bg = kw.get('activebackground', BTN_ACTIVE)
         self._hover_fg = ACCENT
-        self.bind("<Enter>", lambda e: self._on_enter())
-        self.bind("<Leave>", lambda e: self._on_leave())
-
-    def _on_enter(self):
+        if not DarkButton._class_bound:
+            # one Enter/Leave handler pair on the 'DarkButton' bindtag serves
+            # every instance, instead of two Tcl bindings per button
+            self.bind_class('DarkButton', '<Enter>', DarkButton._on_enter)
+            self.bind_class('DarkButton', '<Leave>', DarkButton._on_leave)
+            DarkButton._class_bound = True
+        self.bindtags(self.bindtags() + ('DarkButton',))
+
+    @staticmethod
+    def _on_enter(e):
+        w = e.widget
         try:
-            self.configure(bg=self._hover_bg, fg=self._hover_fg)
+            w.configure(bg=w._hover_bg, fg=w._hover_fg)
         except Exception:
             pass
 
-    def _on_leave(self):
+    @staticmethod
+    def _on_leave(e):
+        w = e.widget
         try:
-            self.configure(bg=self._normal_bg, fg=self._normal_fg)
+            w.configure(bg=w._normal_bg, fg=w._normal_fg)
         except Exception:
             pass
 
@@ -155,16 +313,23 @@ class Launcher:
         # detect music file in assets (few sensible names)
         self.music_file = None
         for name in ('bgmusic.mp3', 'menu_music.mp3', 'bg_launcher.mp3', 'menu_music_launcher.mp3'):
-            p = ASSETS_DIR / name
-            if p.exists():
+            p = _asset_index.get(name)
+            if p is not None:
                 self.music_file = str(p)
                 break
 
         self.logo_img = safe_load_image("logo.png", 200, 48)
 
+        # create the DB schema off the Tk thread; init_db is idempotent and
+        # finishes long before the user can submit the login form
+        threading.Thread(target=db.init_db, daemon=True).start()
+
         # mixer flags
         self._mixer_ready = False
         self._mixer_initialized = False
+        # launcher-side mirror of whether our music is audibly playing, so
+        # hot paths don't round-trip into SDL just to ask
+        self._music_playing = False
 
         # start mixer initialisation on a worker thread (non-blocking)
         self._init_mixer_async()
@@ -172,6 +337,14 @@ class Launcher:
         # Enter key handler tracking
         self._enter_handler = None
 
+        # pending debounced config write (after() id), see save_config_later
+        self._cfg_flush_id = None
+
+        # game module, imported on first Play and reused after that; the Play
+        # view warms it up in the background so Start doesn't stall
+        self._game_module = None
+        self._game_preloading = False
+
         # build UI
         self.container = tk.Frame(self.root, bg=BG)
         self.container.pack(fill='both', expand=True)
@@ -184,9 +357,30 @@ class Launcher:
         else:
             self.show_login()
 
+    # --- config persistence ---
+    def save_config_later(self, delay_ms=500):
+        """Schedule a config write, coalescing bursts into one disk write.
+
+        Used on paths that fire rapidly (the volume slider emits a change per
+        drag tick); each call pushes the pending write back, so a drag ends in
+        a single serialize + write instead of dozens. One-shot paths (login,
+        garage apply, game start) still call save_config directly.
+        """
+        if self._cfg_flush_id is not None:
+            try:
+                self.root.after_cancel(self._cfg_flush_id)
+            except Exception:
+                pass
+        self._cfg_flush_id = self.root.after(delay_ms, self._flush_config)
+
+    def _flush_config(self):
+        self._cfg_flush_id = None
+        save_config(self.cfg)
+
     # --- window / key helpers ---
     def center_window(self, root, w=WIDTH, h=HEIGHT):
-        root.update_idletasks()
+        # no update_idletasks: the size comes from the arguments, and the
+        # screen dimensions are queryable without forcing a layout pass
         ws = root.winfo_screenwidth(); hs = root.winfo_screenheight()
         x = (ws // 2) - (w // 2); y = (hs // 2) - (h // 2)
         root.geometry(f"{w}x{h}+{x}+{y}")
@@ -218,20 +412,20 @@ class Launcher:
     def _update_music_status_label(self):
         """Update textual music status in the footer (UI thread only)."""
         status = "Music: "
-        if not PYGAME_AVAILABLE:
-            status += "disabled (pygame missing)"
-        elif not self.music_file:
+        if not self.music_file:
+            # Checked first: with no file the worker never imports pygame, so
+            # PYGAME_AVAILABLE stays None and the hint would never show.
             status += "no file (place bgmusic.mp3 or menu_music.mp3 in ./assets)"
+        elif PYGAME_AVAILABLE is None:
+            status += "starting..."
+        elif not PYGAME_AVAILABLE:
+            status += "disabled (pygame missing)"
         else:
             try:
-                if not getattr(pg_mixer, 'mixer', None) or not getattr(pg_mixer.mixer, 'get_init', lambda: False)():
+                if not pg_mixer.mixer.get_init():
                     status += "unavailable (mixer not init)"
                 else:
-                    busy = False
-                    try:
-                        busy = pg_mixer.mixer.music.get_busy()
-                    except Exception:
-                        busy = False
+                    busy = pg_mixer.mixer.music.get_busy()
                     if self.cfg.get('music_on', True) and busy:
                         status += "playing"
                     elif not self.cfg.get('music_on', True):
@@ -249,15 +443,31 @@ class Launcher:
         """Initialise pygame.mixer in a background thread and attempt to load/play music.
         Non-blocking to keep the UI responsive.
         """
-        if not PYGAME_AVAILABLE or not self.music_file:
+        if not self.music_file:
             self._mixer_ready = False
             try: self.root.after(0, self._update_music_status_label)
             except Exception: pass
             return
 
         def _init():
+            global pg_mixer, PYGAME_AVAILABLE
+            if pg_mixer is None:
+                try:
+                    import pygame
+                    pg_mixer = pygame
+                    PYGAME_AVAILABLE = True
+                except Exception:
+                    PYGAME_AVAILABLE = False
+            if not PYGAME_AVAILABLE:
+                self._mixer_initialized = False
+                self._mixer_ready = False
+                try:
+                    self.root.after(0, self._update_music_status_label)
+                except Exception:
+                    pass
+                return
             try:
-                if not getattr(pg_mixer.mixer, 'get_init', lambda: False)():
+                if not pg_mixer.mixer.get_init():
                     pg_mixer.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
                 self._mixer_initialized = True
                 try:
@@ -267,7 +477,7 @@ class Launcher:
                     if self.music_on:
                         try:
                             pg_mixer.mixer.music.play(-1)
-                            time.sleep(0.05)  # brief grace so get_busy() is reliable on some platforms
+                            self._music_playing = True
                         except Exception:
                             pass
                 except Exception:
@@ -277,6 +487,9 @@ class Launcher:
                 self._mixer_ready = False
             try:
                 self.root.after(0, self._update_music_status_label)
+                # get_busy() can lag play() on some platforms; instead of
+                # sleeping on the worker thread, re-poll once from the Tk side
+                self.root.after(200, self._update_music_status_label)
             except Exception:
                 pass
 
@@ -289,8 +502,9 @@ class Launcher:
 
         try:
             # if mixer was quit by the game, re-init it
-            if not getattr(pg_mixer.mixer, 'get_init', lambda: False)():
+            if not pg_mixer.mixer.get_init():
                 pg_mixer.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+            self._mixer_initialized = True
 
             # try to (re)load the music file
             try:
@@ -301,10 +515,12 @@ class Launcher:
 
             # set volume and start playing if user wants music
             pg_mixer.mixer.music.set_volume(self.cfg.get('music_volume', self.music_volume))
+            self._music_playing = False
             if self.cfg.get('music_on', True):
                 try:
                     if not pg_mixer.mixer.music.get_busy():
                         pg_mixer.mixer.music.play(-1)
+                    self._music_playing = True
                 except Exception:
                     pass
 
@@ -326,7 +542,7 @@ class Launcher:
         header.pack_propagate(False)
         if self.logo_img:
             tk.Label(header, image=self.logo_img, bg=BG).pack(side='left', padx=(12,6))
-        tk.Label(header, text="CAR DODGER", bg=BG, fg=ACCENT, font=('Orbitron', scaled(18), 'bold')).pack()
+        tk.Label(header, text="CAR DODGER", bg=BG, fg=ACCENT, font=FONT_HDR).pack()
 
         sep = tk.Frame(self.container, bg='#071214', height=4)
         sep.pack(fill='x')
@@ -342,9 +558,9 @@ class Launcher:
         # profile block
         prof = tk.Frame(self.nav, bg=PANEL)
         prof.pack(fill='x', pady=(8,4), padx=6)
-        self.lbl_profile = tk.Label(prof, text="Not logged in", bg=PANEL, fg=FG, font=('Helvetica', scaled(11), 'bold'))
+        self.lbl_profile = tk.Label(prof, text="Not logged in", bg=PANEL, fg=FG, font=FONT_BTN)
         self.lbl_profile.pack(anchor='w')
-        self.lbl_profile_sub = tk.Label(prof, text="Please login or sign up", bg=PANEL, fg=MUTED, font=('Arial', scaled(8)))
+        self.lbl_profile_sub = tk.Label(prof, text="Please login or sign up", bg=PANEL, fg=MUTED, font=FONT_TINY)
         self.lbl_profile_sub.pack(anchor='w')
 
         # navigation buttons
@@ -369,7 +585,7 @@ class Launcher:
         footer.pack(fill='x')
         footer.pack_propagate(False)
 
-        self.music_status_label = tk.Label(footer, text='', bg=BG, fg=MUTED, font=('Arial', scaled(9)))
+        self.music_status_label = tk.Label(footer, text='', bg=BG, fg=MUTED, font=FONT_SMALL)
         self.music_status_label.pack(side='left', padx=10, pady=6)
 
         DarkButton(footer, text="Quit", width=10, command=self._on_quit).pack(side='right', padx=10, pady=6)
@@ -384,13 +600,22 @@ class Launcher:
         for c in self.auth_frame.winfo_children():
             c.destroy()
         if self.user_id:
-            tk.Label(self.auth_frame, text=f"{self.username}", bg=PANEL, fg=FG, font=('Arial', scaled(9), 'bold')).pack(side='left', padx=(0,6))
-            tk.Label(self.auth_frame, text="●", bg=PANEL, fg=ACCENT, font=('Arial', scaled(9))).pack(side='left')
+            tk.Label(self.auth_frame, text=f"{self.username}", bg=PANEL, fg=FG, font=FONT_SMALL_B).pack(side='left', padx=(0,6))
+            tk.Label(self.auth_frame, text="●", bg=PANEL, fg=ACCENT, font=FONT_SMALL).pack(side='left')
         else:
             DarkButton(self.auth_frame, text="Login", width=9, command=self.show_login).pack(side='right', padx=(6,0))
             DarkButton(self.auth_frame, text="Sign Up", width=9, command=self.show_signup).pack(side='right', padx=(0,6))
 
     def clear_card(self):
+        # drop the garage's app-wide wheel bindings so every later wheel tick
+        # doesn't fire a handler aimed at a destroyed canvas
+        if getattr(self, '_garage_wheel_bound', False):
+            for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                try:
+                    self.root.unbind_all(seq)
+                except Exception:
+                    pass
+            self._garage_wheel_bound = False
         for c in list(self.card.winfo_children()):
             if c is self.auth_frame: continue
             try: c.destroy()
@@ -409,10 +634,10 @@ class Launcher:
 
         top = tk.Frame(dlg, bg=PANEL, padx=12, pady=10)
         top.pack(fill='both', expand=True)
-        tk.Label(top, text='Resume previous session?', bg=PANEL, fg=FG, font=('Helvetica', scaled(12), 'bold')).pack(anchor='w')
-        tk.Label(top, text=f'User: {user}', bg=PANEL, fg=MUTED, font=('Arial', scaled(9))).pack(anchor='w', pady=(6,0))
-        tk.Label(top, text='Enter password to resume:', bg=PANEL, fg=MUTED, font=('Arial', scaled(9))).pack(anchor='w', pady=(8,0))
-        pwd = tk.Entry(top, show='*', bg="#070708", fg=FG, insertbackground=FG, relief='flat', font=('Arial', scaled(11)))
+        tk.Label(top, text='Resume previous session?', bg=PANEL, fg=FG, font=FONT_TITLE_SM).pack(anchor='w')
+        tk.Label(top, text=f'User: {user}', bg=PANEL, fg=MUTED, font=FONT_SMALL).pack(anchor='w', pady=(6,0))
+        tk.Label(top, text='Enter password to resume:', bg=PANEL, fg=MUTED, font=FONT_SMALL).pack(anchor='w', pady=(8,0))
+        pwd = tk.Entry(top, show='*', bg="#070708", fg=FG, insertbackground=FG, relief='flat', font=FONT_ENTRY)
         pwd.pack(fill='x', pady=(6,8))
 
         def do_resume():
@@ -422,8 +647,9 @@ class Launcher:
             row = db.verify_user(user, pw)
             if row:
                 self.user_id, car = row; self.username = user; self.selected_car = car or self.selected_car
-                self.cfg['session_active'] = True; self.cfg['last_username'] = user; save_config(self.cfg)
+                self.cfg['session_active'] = True; self.cfg['last_username'] = user
                 dlg.destroy(); self._build_auth_widgets(); self.show_menu_view()
+                self.root.after_idle(save_config, self.cfg)
             else:
                 messagebox.showerror('Error', 'Wrong password', parent=dlg)
 
@@ -438,18 +664,18 @@ class Launcher:
     # --- login / signup views ---
     def show_login(self):
         self.clear_card(); self._build_auth_widgets()
-        tk.Label(self.card, text='Login', bg=PANEL, fg=FG, font=('Helvetica', scaled(13), 'bold')).pack(anchor='w', pady=(0,6))
+        tk.Label(self.card, text='Login', bg=PANEL, fg=FG, font=FONT_TITLE).pack(anchor='w', pady=(0,6))
         frm = tk.Frame(self.card, bg=PANEL); frm.pack(fill='x')
-        tk.Label(frm, text='Username', bg=PANEL, fg=MUTED, font=('Arial', scaled(9))).pack(anchor='w')
-        self.e_user = tk.Entry(frm, bg="#070708", fg=FG, insertbackground=FG, relief='flat', font=('Arial', scaled(11)))
+        tk.Label(frm, text='Username', bg=PANEL, fg=MUTED, font=FONT_SMALL).pack(anchor='w')
+        self.e_user = tk.Entry(frm, bg="#070708", fg=FG, insertbackground=FG, relief='flat', font=FONT_ENTRY)
         self.e_user.pack(fill='x', pady=(4,8))
-        tk.Label(frm, text='Password', bg=PANEL, fg=MUTED, font=('Arial', scaled(9))).pack(anchor='w')
-        self.e_pass = tk.Entry(frm, show='*', bg="#070708", fg=FG, insertbackground=FG, relief='flat', font=('Arial', scaled(11)))
+        tk.Label(frm, text='Password', bg=PANEL, fg=MUTED, font=FONT_SMALL).pack(anchor='w')
+        self.e_pass = tk.Entry(frm, show='*', bg="#070708", fg=FG, insertbackground=FG, relief='flat', font=FONT_ENTRY)
         self.e_pass.pack(fill='x', pady=(4,10))
         row = tk.Frame(self.card, bg=PANEL); row.pack(fill='x', pady=(6,0))
         DarkButton(row, text='Login', width=12, command=self.do_login).pack(side='left')
         DarkButton(row, text='Sign Up', width=12, command=self.show_signup).pack(side='left', padx=(8,0))
-        tk.Label(self.card, text='Ctrl+Q to quit', bg=PANEL, fg=MUTED, font=('Arial', scaled(8))).pack(side='bottom', anchor='w', pady=(12,0))
+        tk.Label(self.card, text='Ctrl+Q to quit', bg=PANEL, fg=MUTED, font=FONT_TINY).pack(side='bottom', anchor='w', pady=(12,0))
 
         self._set_enter_binding(self.do_login)
         self.e_pass.bind('<Return>', lambda e: self.do_login())
@@ -457,13 +683,13 @@ class Launcher:
 
     def show_signup(self):
         self.clear_card(); self._build_auth_widgets()
-        tk.Label(self.card, text='Create Account', bg=PANEL, fg=FG, font=('Helvetica', scaled(13), 'bold')).pack(anchor='w', pady=(0,6))
+        tk.Label(self.card, text='Create Account', bg=PANEL, fg=FG, font=FONT_TITLE).pack(anchor='w', pady=(0,6))
         frm = tk.Frame(self.card, bg=PANEL); frm.pack(fill='x')
-        tk.Label(frm, text='Username', bg=PANEL, fg=MUTED, font=('Arial', scaled(9))).pack(anchor='w')
-        self.s_user = tk.Entry(frm, bg="#070708", fg=FG, insertbackground=FG, relief='flat', font=('Arial', scaled(11)))
+        tk.Label(frm, text='Username', bg=PANEL, fg=MUTED, font=FONT_SMALL).pack(anchor='w')
+        self.s_user = tk.Entry(frm, bg="#070708", fg=FG, insertbackground=FG, relief='flat', font=FONT_ENTRY)
         self.s_user.pack(fill='x', pady=(4,8))
-        tk.Label(frm, text='Password', bg=PANEL, fg=MUTED, font=('Arial', scaled(9))).pack(anchor='w')
-        self.s_pass = tk.Entry(frm, show='*', bg="#070708", fg=FG, insertbackground=FG, relief='flat', font=('Arial', scaled(11)))
+        tk.Label(frm, text='Password', bg=PANEL, fg=MUTED, font=FONT_SMALL).pack(anchor='w')
+        self.s_pass = tk.Entry(frm, show='*', bg="#070708", fg=FG, insertbackground=FG, relief='flat', font=FONT_ENTRY)
         self.s_pass.pack(fill='x', pady=(4,10))
         row = tk.Frame(self.card, bg=PANEL); row.pack(fill='x', pady=(6,0))
         DarkButton(row, text='Create', width=12, command=self.create_account).pack(side='left')
@@ -482,12 +708,34 @@ class Launcher:
 
     def show_play(self):
         self.clear_card(); self._build_auth_widgets()
-        tk.Label(self.card, text='Play', bg=PANEL, fg=FG, font=('Helvetica', scaled(16), 'bold')).pack(anchor='w')
-        start_btn = DarkButton(self.card, text='▶  START', width=20, font=('Helvetica', scaled(18), 'bold'), command=self._ask_difficulty_then_start)
+        tk.Label(self.card, text='Play', bg=PANEL, fg=FG, font=FONT_TITLE_XL).pack(anchor='w')
+        start_btn = DarkButton(self.card, text='▶  START', width=20, font=FONT_START, command=self._ask_difficulty_then_start)
         start_btn.pack(pady=(8,6))
         if not self.user_id:
-            tk.Label(self.card, text='Tip: You can play as guest — scores will not be saved.', bg=PANEL, fg=MUTED, font=('Arial', scaled(9))).pack(anchor='w', pady=(10,0))
+            tk.Label(self.card, text='Tip: You can play as guest — scores will not be saved.', bg=PANEL, fg=MUTED, font=FONT_SMALL).pack(anchor='w', pady=(10,0))
         self._set_enter_binding(self._ask_difficulty_then_start)
+        self._preload_game()
+
+    def _preload_game(self):
+        """Import the game module on a worker thread while the menu is up.
+
+        First Start used to pay the whole pygame import (SDL and all) on the
+        Tk thread. If the user clicks Start mid-import, _launch_game's own
+        import just blocks on the interpreter's import lock and returns the
+        same module, so the race is benign.
+        """
+        if self._game_module is not None or self._game_preloading:
+            return
+        self._game_preloading = True
+
+        def _imp():
+            try:
+                self._game_module = importlib.import_module('game')
+            except Exception:
+                pass  # Start re-imports on the Tk thread and shows the dialog
+            self._game_preloading = False
+
+        threading.Thread(target=_imp, daemon=True).start()
 
     def _ask_difficulty_then_start(self):
         dlg = tk.Toplevel(self.root); dlg.transient(self.root); dlg.grab_set(); dlg.resizable(False, False)
@@ -495,7 +743,7 @@ class Launcher:
         self.center_window(dlg, 360, 220)
 
         hdr = tk.Frame(dlg, bg=PANEL, padx=10, pady=8); hdr.pack(fill='x')
-        tk.Label(hdr, text='Choose Difficulty', bg=PANEL, fg=ACCENT, font=('Helvetica', scaled(12), 'bold')).pack(side='left')
+        tk.Label(hdr, text='Choose Difficulty', bg=PANEL, fg=ACCENT, font=FONT_TITLE_SM).pack(side='left')
         DarkButton(hdr, text='Close', width=8, command=lambda: dlg.destroy()).pack(side='right')
 
         body = tk.Frame(dlg, bg=PANEL, padx=12, pady=10); body.pack(fill='both', expand=True)
@@ -525,30 +773,19 @@ class Launcher:
     def _launch_game(self):
         # pause launcher music (if busy) while the game runs
         did_pause = False
-        if PYGAME_AVAILABLE and getattr(pg_mixer, 'mixer', None) and getattr(pg_mixer.mixer, 'get_init', lambda: None)():
-            try:
-                busy = False
-                try:
-                    busy = pg_mixer.mixer.music.get_busy()
-                except Exception:
-                    busy = False
-                if busy:
-                    try:
-                        pg_mixer.mixer.music.pause()
-                        did_pause = True
-                    except Exception:
-                        did_pause = False
-            except Exception:
-                did_pause = False
-
         try:
-            game = importlib.import_module('game')
+            if PYGAME_AVAILABLE and self._music_playing:
+                pg_mixer.mixer.music.pause()
+                self._music_playing = False
+                did_pause = True
         except Exception:
-            import sys
-            if 'game' in sys.modules:
-                game = importlib.reload(sys.modules['game'])
-            else:
-                game = importlib.import_module('game')
+            did_pause = False
+
+        # import once and keep the module; run_game is re-entrant and reload
+        # would re-execute the module body for nothing
+        game = self._game_module
+        if game is None:
+            game = self._game_module = importlib.import_module('game')
         self.root.withdraw()
         try:
             game.run_game(self.username or 'Guest', self.user_id, self.selected_car, self.difficulty)
@@ -557,6 +794,12 @@ class Launcher:
         finally:
             self.root.deiconify()
 
+            # The game writes config.json itself (pause-menu volume), so the
+            # save_config dedupe blob may no longer match what is on disk;
+            # drop it so the next launcher save always hits the file.
+            global _last_cfg_blob
+            _last_cfg_blob = None
+
             # re-init mixer if the game quit it
             try:
                 self._reinit_mixer_if_needed()
@@ -564,10 +807,10 @@ class Launcher:
                 pass
 
             # resume launcher music if it was paused and user setting allows
-            if did_pause and PYGAME_AVAILABLE and getattr(pg_mixer, 'mixer', None) and getattr(pg_mixer.mixer, 'get_init', lambda: False)():
+            if did_pause and self.cfg.get('music_on', True):
                 try:
-                    if self.cfg.get('music_on', True):
-                        pg_mixer.mixer.music.unpause()
+                    pg_mixer.mixer.music.unpause()
+                    self._music_playing = True
                 except Exception:
                     pass
 
@@ -577,8 +820,9 @@ class Launcher:
     # --- garage ---
     def show_garage(self):
         self.clear_card(); self._build_auth_widgets()
-        tk.Label(self.card, text='Garage', bg=PANEL, fg=FG, font=('Helvetica', scaled(14), 'bold')).pack(anchor='w')
-        car_files = [p.name for p in ASSETS_DIR.glob('player*.png')]
+        tk.Label(self.card, text='Garage', bg=PANEL, fg=FG, font=FONT_TITLE_LG).pack(anchor='w')
+        car_files = sorted(n for n in _asset_index
+                           if n.startswith('player') and n.endswith('.png'))
         if not car_files:
             car_files = ['player1.png','player2.png','player3.png','player4.png']
         grid = tk.Frame(self.card, bg=PANEL); grid.pack(fill='both', expand=True, pady=(8,6))
@@ -605,16 +849,53 @@ class Launcher:
         canvas.bind_all("<MouseWheel>", _on_mousewheel_windows)
         canvas.bind_all("<Button-4>", _on_mousewheel_unix)
         canvas.bind_all("<Button-5>", _on_mousewheel_unix)
+        self._garage_wheel_bound = True  # removed by clear_card on nav away
 
+        pending = []
         for cf in car_files:
             fr = tk.Frame(scrollable_frame, bg=PANEL, pady=4); fr.pack()
-            img = safe_load_image(cf, thumb_w, thumb_h)
+            c = tk.Canvas(fr, width=thumb_w, height=thumb_h, bg='#070708', bd=0, highlightthickness=0)
+            img = _photo_cache.get((cf, thumb_w, thumb_h))
             if img:
-                lbl = tk.Label(fr, image=img, bg=PANEL); lbl.image = img; lbl.pack()
+                c.create_image(thumb_w//2, thumb_h//2, image=img)
             else:
-                c = tk.Canvas(fr, width=thumb_w, height=thumb_h, bg='#070708', bd=0, highlightthickness=0)
-                c.create_rectangle(4,4,thumb_w-4,thumb_h-4, outline=MUTED); c.pack()
+                # placeholder outline; the decoded thumbnail streams in below
+                c.create_rectangle(4,4,thumb_w-4,thumb_h-4, outline=MUTED)
+                pending.append((cf, c))
+            c.pack()
             DarkButton(fr, text='Select', width=10, command=lambda f=cf: self._select_car_from_garage(f)).pack(pady=4)
+
+        if pending:
+            # decode cache-misses off the Tk thread (PIL releases the GIL
+            # while decoding) and hand each finished image back via after();
+            # only the ImageTk upload runs on the Tk side
+            def _decode_worker(jobs):
+                for name, canvas in jobs:
+                    im = _load_pil(name, thumb_w, thumb_h)
+                    if im is None:
+                        continue
+
+                    def _install(name=name, canvas=canvas, im=im):
+                        key = (name, thumb_w, thumb_h)
+                        img = _photo_cache.get(key)
+                        if img is None:
+                            try:
+                                img = ImageTk.PhotoImage(im)
+                            except Exception:
+                                return
+                            _photo_cache[key] = img
+                        try:
+                            canvas.delete('all')
+                            canvas.create_image(thumb_w//2, thumb_h//2, image=img)
+                        except tk.TclError:
+                            pass  # view was closed before the thumb arrived
+
+                    try:
+                        self.root.after(0, _install)
+                    except Exception:
+                        return
+
+            threading.Thread(target=_decode_worker, args=(pending,), daemon=True).start()
         preview = tk.Frame(grid, bg=PANEL); preview.pack(side='left', fill='both', expand=True)
         tk.Label(preview, text='Preview', bg=PANEL, fg=MUTED).pack(anchor='nw')
         self.preview_canvas = tk.Canvas(preview, width=160, height=240, bg='#070708', bd=0, highlightthickness=0)
@@ -639,9 +920,10 @@ class Launcher:
             self.preview_canvas.create_rectangle(4,4,w-4,h-4, outline=MUTED)
 
     def _apply_garage_selection(self):
-        # persist selection in config and DB (if logged in)
+        # persist selection in config and DB (if logged in); the write runs
+        # on the idle tick so the confirmation dialog isn't held up by disk
         self.cfg['selected_car'] = self.selected_car
-        save_config(self.cfg)
+        self.root.after_idle(save_config, self.cfg)
         if self.user_id:
             try:
                 db.set_user_car(self.user_id, self.selected_car)
@@ -651,59 +933,76 @@ class Launcher:
         # present a nicer label for the selected asset name
         stem = _Path(self.selected_car).stem
         nice = stem.replace('_', ' ').strip().title()
-        import re
-        nice = re.sub(r'([A-Za-z])([0-9])', r'\1 \2', nice)
+        nice = _NICE_NAME_RE.sub(r'\1 \2', nice)
 
         messagebox.showinfo('Garage', f'{nice} selected.')
         self.show_menu_view()
 
     # --- leaderboards / settings / help ---
     def show_highscores(self):
-        rows_all = db.top_scores(limit=50, mode=None, distinct=True)
-        rows_casual = db.top_scores(limit=50, mode='Casual', distinct=True)
-        rows_heroic = db.top_scores(limit=50, mode='Heroic', distinct=True)
-        rows_night = db.top_scores(limit=50, mode='Nightmare', distinct=True)
         w = tk.Toplevel(self.root); w.title('High Scores'); w.configure(bg=BG); w.transient(self.root); w.grab_set(); w.resizable(False, False)
         self.center_window(w, 560, 460)
 
         hdr = tk.Frame(w, bg=PANEL, pady=8, padx=10); hdr.pack(fill='x')
-        tk.Label(hdr, text='Leaderboards', bg=PANEL, fg=ACCENT, font=('Helvetica', scaled(12), 'bold')).pack(side='left')
-
-        s = ttk.Style(w); s.theme_use('clam')
-        s.configure('Black.Treeview', background=PANEL, fieldbackground=PANEL, foreground=FG, rowheight=20)
-        s.configure('Black.Treeview.Heading', background=BTN_BG, foreground=FG)
+        tk.Label(hdr, text='Leaderboards', bg=PANEL, fg=ACCENT, font=FONT_TITLE_SM).pack(side='left')
 
-        nb = ttk.Notebook(w); nb.pack(fill='both', expand=True, padx=8, pady=8)
+        # window opens immediately; the four queries run on a worker thread
+        # and the notebook replaces this label when the rows arrive
+        loading = tk.Label(w, text='Loading scores...', bg=BG, fg=MUTED, font=FONT_SMALL)
+        loading.pack(fill='both', expand=True)
 
-        def make_tab(rows):
+        def make_tab(nb, rows):
             frame = tk.Frame(nb, bg=PANEL)
             tree = ttk.Treeview(frame, columns=('rank','player','score','mode','date'), show='headings', height=14, style='Black.Treeview')
             tree.heading('rank', text='Rank'); tree.heading('player', text='Player'); tree.heading('score', text='Score'); tree.heading('mode', text='Mode'); tree.heading('date', text='Date')
             tree.column('rank', width=50, anchor='center'); tree.column('player', width=160, anchor='w')
             tree.column('score', width=80, anchor='e'); tree.column('mode', width=90, anchor='center'); tree.column('date', width=100, anchor='center')
-            tree.pack(fill='both', expand=True, padx=6, pady=6)
+            # build the display rows in Python first, then bulk-insert into
+            # the still-unpacked tree so Tk lays it out once, not per row
             if not rows:
-                tree.insert('', 'end', values=(1, '---', 0, '---', '---'))
+                items = [(1, '---', 0, '---', '---')]
             else:
-                rnk = 1
-                for r in rows:
-                    uname, sc, mode, created = r; created_date = (created or '')[:10]
-                    uname_disp = uname if len(uname) <= 20 else uname[:17] + '...'
-                    tree.insert('', 'end', values=(rnk, uname_disp, sc, mode or '-', created_date)); rnk += 1
+                items = [(rnk, u if len(u) <= 20 else u[:17] + '...',
+                          sc, mode or '-', (created or '')[:10])
+                         for rnk, (u, sc, mode, created) in enumerate(rows, start=1)]
+            insert = tree.insert
+            for v in items:
+                insert('', 'end', values=v)
+            tree.pack(fill='both', expand=True, padx=6, pady=6)
             return frame
 
-        nb.add(make_tab(rows_all), text='All')
-        nb.add(make_tab(rows_casual), text='Casual')
-        nb.add(make_tab(rows_heroic), text='Heroic')
-        nb.add(make_tab(rows_night), text='Nightmare')
-
         ftr = tk.Frame(w, bg=BG, pady=6); ftr.pack(fill='x')
         DarkButton(ftr, text='Close', width=12, command=w.destroy).pack()
         w.bind('<Return>', lambda e: w.destroy()); w.bind('<Escape>', lambda e: w.destroy())
 
+        def populate(results):
+            try:
+                loading.destroy()
+                nb = ttk.Notebook(w)
+                nb.pack(fill='both', expand=True, padx=8, pady=8, before=ftr)
+                for label, rows in zip(('All', 'Casual', 'Heroic', 'Nightmare'), results):
+                    nb.add(make_tab(nb, rows), text=label)
+            except tk.TclError:
+                pass  # window was closed before the rows arrived
+
+        def fetch():
+            try:
+                results = (db.top_scores(limit=50, mode=None, distinct=True),
+                           db.top_scores(limit=50, mode='Casual', distinct=True),
+                           db.top_scores(limit=50, mode='Heroic', distinct=True),
+                           db.top_scores(limit=50, mode='Nightmare', distinct=True))
+            except Exception:
+                results = ([], [], [], [])
+            try:
+                self.root.after(0, lambda: populate(results))
+            except Exception:
+                pass
+
+        threading.Thread(target=fetch, daemon=True).start()
+
     def show_settings(self):
         self.clear_card(); self._build_auth_widgets()
-        tk.Label(self.card, text='Settings', bg=PANEL, fg=FG, font=('Helvetica', scaled(14), 'bold')).pack(anchor='w')
+        tk.Label(self.card, text='Settings', bg=PANEL, fg=FG, font=FONT_TITLE_LG).pack(anchor='w')
         sp = tk.Frame(self.card, bg=PANEL); sp.pack(fill='x', pady=(8,6))
         music_frame = tk.Frame(sp, bg=PANEL); music_frame.pack(fill='x', pady=4)
         self.music_var = tk.BooleanVar(value=self.cfg.get('music_on', True))
@@ -720,60 +1019,49 @@ class Launcher:
         self._set_enter_binding(self._save_settings)
         self.root.bind('<Escape>', lambda e: self.show_menu_view())
 
-    def _toggle_music(self):
-        self.music_on = not self.music_var.get(); self.music_var.set(self.music_on)
-        self.cfg['music_on'] = self.music_on; save_config(self.cfg)
-        if not PYGAME_AVAILABLE or not self.music_file:
-            messagebox.showinfo('Music', 'pygame or music file not available; music control disabled.')
-            self._update_music_status_label()
+    def _apply_music_state(self, on, volume):
+        """Drive the mixer to the requested on/off + volume state.
+
+        Single home for the play/unpause/pause/set_volume dance shared by the
+        toggle button and the settings save; uses the cached flags so the
+        happy path is a couple of direct SDL calls.
+        """
+        if not (PYGAME_AVAILABLE and self._mixer_initialized and self.music_file):
             return
         try:
-            if not getattr(pg_mixer.mixer, 'get_init', lambda: False)():
-                return
-            if self.music_on:
-                try:
-                    busy = pg_mixer.mixer.music.get_busy()
-                except Exception:
-                    busy = False
-                if not busy:
-                    pg_mixer.mixer.music.play(-1)
+            music = pg_mixer.mixer.music
+            if on:
+                if not self._music_playing:
+                    music.play(-1)
                 else:
-                    pg_mixer.mixer.music.unpause()
-                pg_mixer.mixer.music.set_volume(self.music_volume)
+                    music.unpause()
+                self._music_playing = True
+                music.set_volume(volume)
             else:
-                pg_mixer.mixer.music.pause()
+                music.pause()
+                self._music_playing = False
         except Exception:
             pass
 
+    def _toggle_music(self):
+        self.music_on = not self.music_var.get(); self.music_var.set(self.music_on)
+        self.cfg['music_on'] = self.music_on; self.save_config_later()
+        if not PYGAME_AVAILABLE or not self.music_file:
+            messagebox.showinfo('Music', 'pygame or music file not available; music control disabled.')
+            self._update_music_status_label()
+            return
+        self._apply_music_state(self.music_on, self.music_volume)
         self._update_music_status_label()
 
     def _on_volume_change(self, _=None):
-        v = float(self.volume_var.get()); self.music_volume = v; self.cfg['music_volume'] = v; save_config(self.cfg)
-        if PYGAME_AVAILABLE and getattr(pg_mixer, 'mixer', None) and getattr(pg_mixer.mixer, 'get_init', lambda: False)():
+        v = float(self.volume_var.get()); self.music_volume = v; self.cfg['music_volume'] = v; self.save_config_later()
+        if PYGAME_AVAILABLE:
             try: pg_mixer.mixer.music.set_volume(v)
             except Exception: pass
 
     def _save_settings(self):
         self.cfg['music_on'] = bool(self.music_var.get()); self.cfg['music_volume'] = float(self.volume_var.get()); save_config(self.cfg)
-        if PYGAME_AVAILABLE and self.music_file:
-            try:
-                if not getattr(pg_mixer.mixer, 'get_init', lambda: False)():
-                    pass
-                else:
-                    if self.cfg['music_on']:
-                        try:
-                            if not pg_mixer.mixer.music.get_busy():
-                                pg_mixer.mixer.music.play(-1)
-                            else:
-                                pg_mixer.mixer.music.unpause()
-                        except Exception:
-                            try: pg_mixer.mixer.music.play(-1)
-                            except Exception: pass
-                    else:
-                        pg_mixer.mixer.music.pause()
-                    pg_mixer.mixer.music.set_volume(self.cfg['music_volume'])
-            except Exception:
-                pass
+        self._apply_music_state(self.cfg['music_on'], self.cfg['music_volume'])
         messagebox.showinfo('Settings', 'Settings saved.')
         self._update_music_status_label()
 
@@ -781,34 +1069,12 @@ class Launcher:
         w = tk.Toplevel(self.root); w.title('Help — Car Dodger'); w.configure(bg=BG); w.transient(self.root); w.grab_set(); w.resizable(False, False)
         self.center_window(w, 540, 420)
         hdr = tk.Frame(w, bg=PANEL, padx=10, pady=8); hdr.pack(fill='x')
-        tk.Label(hdr, text='Help — Car Dodger', bg=PANEL, fg=ACCENT, font=('Helvetica', scaled(12), 'bold')).pack(side='left')
+        tk.Label(hdr, text='Help — Car Dodger', bg=PANEL, fg=ACCENT, font=FONT_TITLE_SM).pack(side='left')
         DarkButton(hdr, text='Close', width=8, command=w.destroy).pack(side='right')
 
-        txt = tk.Text(w, bg=PANEL, fg=FG, bd=0, wrap='word', font=('Arial', scaled(10)))
+        txt = tk.Text(w, bg=PANEL, fg=FG, bd=0, wrap='word', font=FONT_BODY)
         txt.pack(fill='both', expand=True, padx=8, pady=(4,8))
-        help_text = """Car Dodger — Help
-
-Controls:
-  - Left arrow / A : Move left one lane
-  - Right arrow / D: Move right one lane
-  - P              : Pause / Resume during gameplay
-  - L              : Open in-game Leaderboards (pauses the game)
-  - Esc            : Close menus / return to launcher menu
-  - Mouse click    : Use buttons in menus
-
-Gameplay:
-  - Avoid enemy cars. If they collide with you (pixel-perfect or central hitbox), it's game over.
-  - When an enemy passes your car, you get points:
-      * Close pass (near center): +250
-      * Regular pass: +150
-  - Difficulty affects spawn speed, enemy speed, and max enemies.
-
-Score & Leaderboards:
-  - Leaderboards are per-mode and show the best score per player.
-  - Dates shown are YYYY-MM-DD.
-  - To post scores, be logged in before starting the game.
-"""
-        txt.insert('1.0', help_text); txt.configure(state='disabled')
+        txt.insert('1.0', HELP_TEXT); txt.configure(state='disabled')
         DarkButton(w, text='Close', width=10, command=w.destroy).pack(pady=6)
         w.bind('<Return>', lambda e: w.destroy()); w.bind('<Escape>', lambda e: w.destroy())
 
@@ -820,7 +1086,8 @@ Score & Leaderboards:
         ok = db.add_user(u, p)
         if ok:
             messagebox.showinfo('Success', 'Account created. Login now.')
-            self.cfg['last_username'] = u; self.cfg['session_active'] = False; save_config(self.cfg); self.show_login()
+            self.cfg['last_username'] = u; self.cfg['session_active'] = False; self.show_login()
+            self.root.after_idle(save_config, self.cfg)
         else:
             messagebox.showerror('Error', 'Username exists')
 
@@ -831,8 +1098,9 @@ Score & Leaderboards:
         row = db.verify_user(u, p)
         if row:
             self.user_id, car = row; self.username = u; self.selected_car = car or self.selected_car
-            self.cfg['last_username'] = u; self.cfg['session_active'] = True; self.cfg['selected_car'] = self.selected_car; save_config(self.cfg)
+            self.cfg['last_username'] = u; self.cfg['session_active'] = True; self.cfg['selected_car'] = self.selected_car
             self._build_auth_widgets(); self.show_menu_view()
+            self.root.after_idle(save_config, self.cfg)
         else:
             messagebox.showerror('Error', 'Invalid credentials')
 
@@ -841,20 +1109,29 @@ Score & Leaderboards:
         if self.user_id:
             try: db.set_user_car(self.user_id, filename)
             except Exception: pass
-        self.cfg['selected_car'] = filename; save_config(self.cfg); self.show_menu_view()
+        self.cfg['selected_car'] = filename; self.show_menu_view()
+        self.root.after_idle(save_config, self.cfg)
 
     def logout(self):
         if not self.user_id: messagebox.showinfo('Logout', 'Not logged in.'); return
         self.user_id = None; self.username = None
-        self.cfg.pop('last_username', None); self.cfg['session_active'] = False; save_config(self.cfg)
+        self.cfg.pop('last_username', None); self.cfg['session_active'] = False
         self.selected_car = self.cfg.get('selected_car', DEFAULT_CONFIG['selected_car'])
         self._build_auth_widgets(); self.show_login()
+        self.root.after_idle(save_config, self.cfg)
 
     def _on_quit(self):
         # confirm then stop music and destroy window
         if messagebox.askokcancel("Quit", "Quit Car Dodger launcher?"):
+            # flush any debounced config write before the window goes away
+            if self._cfg_flush_id is not None:
+                try:
+                    self.root.after_cancel(self._cfg_flush_id)
+                except Exception:
+                    pass
+                self._flush_config()
             try:
-                if PYGAME_AVAILABLE and getattr(pg_mixer, 'mixer', None):
+                if PYGAME_AVAILABLE:
                     try:
                         pg_mixer.mixer.music.stop()
                     except Exception:
@@ -876,6 +1153,10 @@ if __name__ == '__main__':
     style = ttk.Style()
     try: style.theme_use('clam')
     except Exception: pass
-    style.configure('Dark.TRadiobutton', background=PANEL, foreground=FG, font=('Arial', scaled(9)))
-    style.configure('Dark.TCheckbutton', background=PANEL, foreground=FG, font=('Arial', scaled(9)))
+    style.configure('Dark.TRadiobutton', background=PANEL, foreground=FG, font=FONT_SMALL)
+    style.configure('Dark.TCheckbutton', background=PANEL, foreground=FG, font=FONT_SMALL)
+    # ttk styles are process-global, so the leaderboard Treeview styling is
+    # done once here instead of on every High Scores open
+    style.configure('Black.Treeview', background=PANEL, fieldbackground=PANEL, foreground=FG, rowheight=20)
+    style.configure('Black.Treeview.Heading', background=BTN_BG, foreground=FG)
     Launcher(root); root.mainloop()